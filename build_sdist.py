@@ -3,33 +3,57 @@
 Build script for splurge-tools source distributions only.
 
 This script ensures only source distributions are built, not wheels.
+Pass ``--verbose`` to stream the build output and report the created files;
+without it the output is only printed if the build fails.
 """
 
+import argparse
+import logging
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+log = logging.getLogger("build_sdist")
+
 
 def clean_build_artifacts():
     """Clean up build artifacts."""
     artifacts = ["dist", "build", "splurge_tools.egg-info"]
     for artifact in artifacts:
         if Path(artifact).exists():
+            log.info("Removing %s", artifact)
             shutil.rmtree(artifact)
 
 
-def build_sdist():
+def build_sdist(verbose=False):
     """Build source distribution only."""
-    result = subprocess.run([sys.executable, "-m", "build", "--sdist"], check=False, capture_output=True, text=True)
+    # Stream build output as it is produced when verbose; otherwise keep it for a failure report
+    captured = []
+    with subprocess.Popen(
+        [sys.executable, "-m", "build", "--sdist"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        if proc.stdout is not None:
+            for line in proc.stdout:
+                if verbose:
+                    sys.stdout.write(line)
+                else:
+                    captured.append(line)
+        returncode = proc.wait()
 
-    if result.returncode == 0:
+    if returncode == 0:
         # List the created files
         dist_dir = Path("dist")
         if dist_dir.exists():
-            for _file in dist_dir.glob("*.tar.gz"):
-                pass
+            for file in dist_dir.glob("*.tar.gz"):
+                log.info("Created %s", file)
     else:
+        sys.stdout.writelines(captured)
+        log.warning("Build failed with exit code %d", returncode)
         return False
 
     return True
@@ -37,13 +61,18 @@ def build_sdist():
 
 def main():
     """Main build process."""
+    parser = argparse.ArgumentParser(description="Build splurge-tools source distribution.")
+    parser.add_argument("-v", "--verbose", action="store_true", help="stream build output and report progress")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format="%(message)s")
 
     # Clean previous builds
     clean_build_artifacts()
 
     # Build sdist
-    if build_sdist():
-        pass
+    if build_sdist(verbose=args.verbose):
+        log.info("Source distribution built successfully")
     else:
         sys.exit(1)
 
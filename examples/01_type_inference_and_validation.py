@@ -10,9 +10,15 @@ Licensed under the MIT License.
 """
 
 import contextlib
+from functools import lru_cache
+from itertools import chain
 
 from splurge_tools.type_helper import DataType, String, profile_values
 
+# The examples infer types for small, highly repetitive inputs ("true", "false", "123", ...),
+# so memoize per-value inference instead of re-running the full type checks each time.
+_infer_type = lru_cache(maxsize=None)(String.infer_type)
+
 
 def basic_type_inference_examples():
     """Demonstrate basic type inference capabilities."""
@@ -32,7 +38,7 @@ def basic_type_inference_examples():
     ]
 
     for value in test_values:
-        String.infer_type(value)
+        _infer_type(value)
 
 
 def type_validation_examples():
@@ -92,7 +98,7 @@ def collection_type_profiling():
         profile_values(data)
 
         # Show individual type inferences
-        [String.infer_type(value).name for value in data]
+        [_infer_type(value).name for value in data]
 
 
 def advanced_type_scenarios():
@@ -112,7 +118,7 @@ def advanced_type_scenarios():
     ]
 
     for value in edge_cases:
-        inferred_type = String.infer_type(value)
+        inferred_type = _infer_type(value)
 
         # Try to convert based on inferred type
         try:
@@ -133,14 +139,13 @@ def advanced_type_scenarios():
 def performance_considerations():
     """Demonstrate performance considerations with large datasets."""
 
-    # Generate a large dataset for performance testing
-    large_dataset = []
-
-    # Add various types of data
-    large_dataset.extend([str(i) for i in range(1000)])  # Integers
-    large_dataset.extend([f"{i}.{i}" for i in range(100)])  # Floats
-    large_dataset.extend(["true", "false"] * 50)  # Booleans
-    large_dataset.extend([f"2023-{i:02d}-01" for i in range(1, 13)])  # Dates
+    # Generate a large dataset for performance testing as a lazy iterator
+    large_dataset = chain(
+        (str(i) for i in range(1000)),  # Integers
+        (f"{i}.{i}" for i in range(100)),  # Floats
+        (value for _ in range(50) for value in ("true", "false")),  # Booleans
+        (f"2023-{i:02d}-01" for i in range(1, 13)),  # Dates
+    )
 
     # Profile the large dataset - this uses optimized incremental checking
     profile_values(large_dataset, use_incremental_typecheck=True)
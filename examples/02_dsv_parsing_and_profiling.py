@@ -11,6 +11,7 @@ Licensed under the MIT License.
 
 import contextlib
 import tempfile
+from itertools import chain
 from pathlib import Path
 
 from splurge_tools.dsv_helper import DsvHelper
@@ -31,9 +32,8 @@ Alice Brown,35,Houston,72000.25,2023-05-05,true
 Charlie Wilson,28,Phoenix,68000.00,2023-02-14,true"""
 
     # Large CSV for streaming demonstration
-    large_csv_content = "ID,Value,Category,Timestamp\n"
-    for i in range(1000):
-        large_csv_content += f"{i},{i * 10.5},Category{i % 5},2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}\n"
+    large_rows = [f"{i},{i * 10.5},Category{i % 5},2023-{(i % 12) + 1:02d}-{(i % 28) + 1:02d}" for i in range(1000)]
+    large_csv_content = "ID,Value,Category,Timestamp\n" + "\n".join(large_rows) + "\n"
 
     # CSV with special characters and bookends
     special_csv_content = '''"Product Name","Description","Price","In Stock"
@@ -41,15 +41,15 @@ Charlie Wilson,28,Phoenix,68000.00,2023-02-14,true"""
 "Gadget, Standard","Basic gadget, nothing special","$15.50","No"
 "Tool Set","Complete tool set, includes: hammer, screwdriver, wrench","$45.00","Yes"'''
 
-    # Write files
+    # Write files as pre-encoded bytes (no text-layer encoding or newline translation)
     files = {}
     files["basic"] = temp_dir / "employees.csv"
     files["large"] = temp_dir / "large_dataset.csv"
     files["special"] = temp_dir / "products.csv"
 
-    files["basic"].write_text(csv_content)
-    files["large"].write_text(large_csv_content)
-    files["special"].write_text(special_csv_content)
+    files["basic"].write_bytes(csv_content.encode("utf-8"))
+    files["large"].write_bytes(large_csv_content.encode("utf-8"))
+    files["special"].write_bytes(special_csv_content.encode("utf-8"))
 
     return temp_dir, files
 
@@ -98,7 +98,7 @@ def advanced_dsv_parsing_examples(files):
 
     # Create temporary tab file
     temp_tab_file = files["basic"].parent / "temp_tab.tsv"
-    temp_tab_file.write_text(tab_data)
+    temp_tab_file.write_bytes(tab_data.encode("utf-8"))
 
     tab_parsed = DsvHelper.parse_file(temp_tab_file, delimiter="\t")
     for _i, _row in enumerate(tab_parsed):
@@ -136,34 +136,28 @@ def streaming_dsv_examples(files):
 
 
 def dsv_profiling_examples(files):
-    """Demonstrate DSV data profiling capabilities."""
+    """Demonstrate DSV data profiling capabilities.
 
-    # Parse and profile the basic employee data
-    employee_data = DsvHelper.parse_file(files["basic"], delimiter=",")
+    Returns a profile per column name: the inferred data type and the first two values.
+    """
 
-    # Profile columns using DsvHelper
-    # Note: We need to extract the data without headers for profiling
-    data_without_headers = employee_data[1:]  # Skip header row
+    # Stream the employee data once, projecting each row into per-column lists
+    rows = chain.from_iterable(DsvHelper.parse_stream(files["basic"], delimiter=","))
+    column_names = next(rows, [])  # Header row
+    num_columns = len(column_names)
+    columns: list[list[str]] = [[] for _ in range(num_columns)]
+    for row in rows:
+        for col_idx, value in enumerate(row[:num_columns]):
+            columns[col_idx].append(value)
 
-    # Analyze each column
-    if data_without_headers:
-        num_columns = len(data_without_headers[0])
-        column_names = employee_data[0]  # Header row
+    # Profile each non-empty column exactly once
+    column_types = {col_idx: profile_values(col_values) for col_idx, col_values in enumerate(columns) if col_values}
 
-        for col_idx in range(num_columns):
-            column_names[col_idx]
-            col_values = [row[col_idx] for row in data_without_headers if len(row) > col_idx]
-
-    # Demonstrate type inference on columns
-
-    if data_without_headers:
-        for col_idx in range(num_columns):
-            column_names[col_idx]
-            col_values = [row[col_idx] for row in data_without_headers if len(row) > col_idx]
-
-            if col_values:
-                profile_values(col_values)
-                col_values[:2]  # Show first 2 values
+    # Demonstrate type inference on columns, pairing each inferred type with sample values
+    return {
+        column_names[col_idx]: (col_type, columns[col_idx][:2])  # Show first 2 values
+        for col_idx, col_type in column_types.items()
+    }
 
 
 def error_handling_examples(files):
@@ -187,7 +181,7 @@ Jane,25  # Missing city
 Bob,45,Chicago,Extra Field"""
 
     temp_malformed = files["basic"].parent / "malformed.csv"
-    temp_malformed.write_text(malformed_csv)
+    temp_malformed.write_bytes(malformed_csv.encode("utf-8"))
 
     try:
         malformed_data = DsvHelper.parse_file(temp_malformed, delimiter=",")
@@ -217,7 +211,8 @@ if __name__ == "__main__":
         basic_dsv_parsing_examples(files)
         advanced_dsv_parsing_examples(files)
         streaming_dsv_examples(files)
-        dsv_profiling_examples(files)
+        for _column_name, (_col_type, _samples) in dsv_profiling_examples(files).items():
+            pass
         error_handling_examples(files)
 
     finally:
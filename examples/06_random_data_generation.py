@@ -11,10 +11,15 @@ Licensed under the MIT License.
 """
 
 import contextlib
+import string
 from datetime import date
 
 from splurge_tools.random_helper import RandomHelper
 
+_ALPHA_SET = frozenset(RandomHelper.BASE58_ALPHA)
+_DIGIT_SET = frozenset(RandomHelper.BASE58_DIGITS)
+_SYMBOL_SET = frozenset(RandomHelper.SYMBOLS)
+
 
 def basic_random_generation_examples():
     """Demonstrate basic random value generation."""
@@ -35,9 +40,9 @@ def string_generation_examples():
 def base58_like_generation_examples():
     """Demonstrate Base58-like string generation with guaranteed diversity."""
 
-    # Basic Base58-like generation
-    for _i in range(5):
-        RandomHelper.as_base58_like(20)
+    # Basic Base58-like generation (strings of one size are drawn together in a single batch)
+    for _value in RandomHelper.as_base58_like_batch(20, 5):
+        pass
 
     # Different lengths
     lengths = [8, 16, 32, 64]
@@ -46,73 +51,84 @@ def base58_like_generation_examples():
 
     # With custom symbols
     custom_symbols = "!@#$"
-    for _i in range(3):
-        RandomHelper.as_base58_like(24, symbols=custom_symbols)
+    for _value in RandomHelper.as_base58_like_batch(24, 3, symbols=custom_symbols):
+        pass
 
     # Without symbols (alpha + digits only)
-    for _i in range(3):
-        RandomHelper.as_base58_like(20, symbols="")
+    for _value in RandomHelper.as_base58_like_batch(20, 3, symbols=""):
+        pass
 
     # Secure generation
-    for _i in range(3):
-        RandomHelper.as_base58_like(32, secure=True)
+    for _value in RandomHelper.as_base58_like_batch(32, 3, secure=True):
+        pass
 
     # Demonstrate character diversity guarantee
     test_string = RandomHelper.as_base58_like(50)
 
-    any(c in RandomHelper.BASE58_ALPHA for c in test_string)
-    any(c in RandomHelper.BASE58_DIGITS for c in test_string)
-    any(c in RandomHelper.SYMBOLS for c in test_string)
+    # One set build over the distinct characters, then three disjointness checks
+    chars = set(test_string)
+    not chars.isdisjoint(_ALPHA_SET)
+    not chars.isdisjoint(_DIGIT_SET)
+    not chars.isdisjoint(_SYMBOL_SET)
 
 
 def date_generation_examples():
     """Demonstrate date and time generation."""
 
-    # Date ranges using days from today
-    for _i in range(5):
-        # Generate dates between -365 days (past year) and +365 days (next year)
-        RandomHelper.as_date(-365, 365)
+    # Date ranges using days from today; a batch of dates is drawn in one call
+    # Generate dates between -365 days (past year) and +365 days (next year)
+    for _random_date in RandomHelper.as_date_batch(-365, 365, 5):
+        pass
 
-    for _i in range(3):
-        RandomHelper.as_date(-365, 365, secure=True)
+    for _random_date in RandomHelper.as_date_batch(-365, 365, 3, secure=True):
+        pass
 
     # Recent dates (last 30 days)
-    for _i in range(5):
+    today = date.today()
+    for recent_date in RandomHelper.as_date_batch(-30, 0, 5, base_date=today):
         # Generate dates between -30 and 0 days from today
-        recent_date = RandomHelper.as_date(-30, 0)
-        (date.today() - recent_date).days
+        (today - recent_date).days
 
 
 def practical_use_cases():
     """Demonstrate practical use cases for random data generation."""
 
     # API Key generation
-    api_keys = []
-    for _i in range(3):
-        api_key = RandomHelper.as_base58_like(32, secure=True)
-        api_keys.append(api_key)
+    for _api_key in RandomHelper.as_base58_like_batch(32, 3, secure=True):
+        pass
 
     # Session tokens
-    for _i in range(3):
-        RandomHelper.as_base58_like(24, symbols="", secure=True)
+    for _token in RandomHelper.as_base58_like_batch(24, 3, symbols="", secure=True):
+        pass
 
     # Test user IDs
-    for _i in range(5):
-        RandomHelper.as_int_range(100000, 999999)
+    for _user_id in RandomHelper.as_int_range_batch(100000, 999999, 5):
+        pass
 
-    # Random test data
+    # Random test data, drawn one column at a time with the batch generators and zipped into records
     departments = ["Engineering", "Marketing", "Sales", "HR", "Finance"]
     cities = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"]
 
-    for _i in range(5):
+    record_count = 5
+    columns = zip(
+        RandomHelper.as_int_range_batch(1000, 9999, record_count),
+        RandomHelper.as_int_range_batch(1, 1000, record_count),
+        RandomHelper.as_int_range_batch(0, len(departments) - 1, record_count),
+        RandomHelper.as_int_range_batch(0, len(cities) - 1, record_count),
+        RandomHelper.as_int_range_batch(40000, 120000, record_count),
+        RandomHelper.as_bool_batch(record_count),
+        RandomHelper.as_date_batch(-1000, -100, record_count),  # Random date in past 1000-100 days
+        strict=True,
+    )
+    for id_, name_id, dept_ix, city_ix, salary, active, start_date in columns:
         {
-            "id": RandomHelper.as_int_range(1000, 9999),
-            "name": f"Employee_{RandomHelper.as_int_range(1, 1000)}",
-            "department": departments[RandomHelper.as_int_range(0, len(departments) - 1)],
-            "city": cities[RandomHelper.as_int_range(0, len(cities) - 1)],
-            "salary": RandomHelper.as_int_range(40000, 120000),
-            "active": RandomHelper.as_bool(),
-            "start_date": RandomHelper.as_date(-1000, -100),  # Random date in past 1000-100 days
+            "id": id_,
+            "name": f"Employee_{name_id}",
+            "department": departments[dept_ix],
+            "city": cities[city_ix],
+            "salary": salary,
+            "active": active,
+            "start_date": start_date,
         }
 
 
@@ -123,10 +139,13 @@ def performance_and_security_examples():
 
     # Security features demonstration
 
-    # Show that secure generation produces different results
-    for _i in range(3):
-        RandomHelper.as_base58_like(16, secure=False)
-        RandomHelper.as_base58_like(16, secure=True)
+    # Show that secure generation produces different results (one batched draw per mode)
+    for _plain, _secure in zip(
+        RandomHelper.as_base58_like_batch(16, 3, secure=False),
+        RandomHelper.as_base58_like_batch(16, 3, secure=True),
+        strict=True,
+    ):
+        pass
 
     # Demonstrate symbol validation
     valid_symbols = "!@#$%"
@@ -143,26 +162,27 @@ def batch_generation_examples():
     # Generate batch of test data
 
     # Generate multiple API keys
-    api_keys = [RandomHelper.as_base58_like(32) for _ in range(10)]
+    api_keys = RandomHelper.as_base58_like_batch(32, 10)
     for _i, _key in enumerate(api_keys, 1):
         pass
 
-    # Generate test dataset
-    test_records = []
-    for _i in range(20):
-        record = {
-            "id": RandomHelper.as_int_range(1, 10000),
-            "score": round(RandomHelper.as_float_range(0.0, 100.0), 2),
-            "category": chr(65 + RandomHelper.as_int_range(0, 25)),  # A-Z
-            "active": RandomHelper.as_bool(),
-            "token": RandomHelper.as_base58_like(12, symbols=""),
-        }
-        test_records.append(record)
+    # Generate test dataset one column at a time: a single bulk draw feeds each column,
+    # so the per-record loop only packs already-drawn values into dicts.
+    record_count = 20
+    ids = RandomHelper.as_int_range_batch(1, 10000, record_count)
+    scores = [round(score, 2) for score in RandomHelper.as_float_range_batch(0.0, 100.0, record_count)]
+    categories = RandomHelper.as_string(record_count, string.ascii_uppercase)  # A-Z
+    actives = RandomHelper.as_bool_batch(record_count)
+    tokens = RandomHelper.as_base58_like_batch(12, record_count, symbols="")
+    test_records = [
+        {"id": id_, "score": score, "category": category, "active": active, "token": token}
+        for id_, score, category, active, token in zip(ids, scores, categories, actives, tokens, strict=True)
+    ]
 
-    # Show summary statistics
-    sum(1 for r in test_records if r["active"])
-    sum(r["score"] for r in test_records) / len(test_records)
-    len({r["category"] for r in test_records})
+    # Show summary statistics, reduced straight from the columns rather than re-walking the records
+    sum(actives)
+    sum(scores) / record_count
+    len(set(categories))
 
     # Show sample records
     for record in test_records[:5]:
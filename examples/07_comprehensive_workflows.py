@@ -10,7 +10,10 @@ Licensed under the MIT License.
 """
 
 import tempfile
-from datetime import date, timedelta
+from collections import Counter
+from datetime import date
+from itertools import islice
+from operator import itemgetter, mul
 from pathlib import Path
 
 from splurge_tools.case_helper import CaseHelper
@@ -24,6 +27,12 @@ from splurge_tools.text_normalizer import TextNormalizer
 
 # from splurge_tools.factory import ComponentFactory, DataModelFactory
 
+# Field accessors for the order rows in the large streaming dataset
+_CATEGORY = itemgetter(2)
+_PRICE = itemgetter(3)
+_QUANTITY = itemgetter(4)
+_CUSTOMER_ID = itemgetter(6)
+
 
 def create_messy_dataset():
     """Create a realistic messy dataset for processing."""
@@ -42,23 +51,23 @@ Sarah Davis,45,"Finance, Accounting",invalid_salary,sarah@company.com,2023-01-20
 Mike Wilson,35,"Sales, Regional",95000,mike@invalid-domain.com,2022-12-15,true
 Lisa Garcia,29,"Engineering, Frontend",78000,lisa@company.com,2023-04-10,active"""
 
-    # Large dataset for streaming
-    large_csv_header = "ID,Product,Category,Price,Quantity,Date,Customer_ID\n"
-    large_csv_content = large_csv_header
-
+    # Large dataset for streaming, generated column-wise with the RandomHelper batch generators;
+    # the rows are joined once instead of appended with +=
+    row_count = 5000
     categories = ["Electronics", "Clothing", "Books", "Home", "Sports"]
     products = ["Widget", "Gadget", "Tool", "Device", "Item"]
 
-    for i in range(5000):
-        product = f"{products[i % len(products)]}_{i}"
-        category = categories[i % len(categories)]
-        price = round(RandomHelper.as_float_range(10.0, 500.0), 2)
-        quantity = RandomHelper.as_int_range(1, 10)
-        days_ago = RandomHelper.as_int_range(0, 365)
-        order_date = date.today() - timedelta(days=days_ago)
-        customer_id = RandomHelper.as_int_range(1000, 9999)
+    prices = [round(price, 2) for price in RandomHelper.as_float_range_batch(10.0, 500.0, row_count)]
+    quantities = RandomHelper.as_int_range_batch(1, 10, row_count)
+    order_dates = RandomHelper.as_date_batch(-365, 0, row_count)
+    customer_ids = RandomHelper.as_int_range_batch(1000, 9999, row_count)
 
-        large_csv_content += f"{i},{product},{category},{price},{quantity},{order_date},{customer_id}\n"
+    large_csv_content = "ID,Product,Category,Price,Quantity,Date,Customer_ID\n" + "".join(
+        f"{i},{products[i % len(products)]}_{i},{categories[i % len(categories)]},{price},{quantity},{order_date},{customer_id}\n"
+        for i, price, quantity, order_date, customer_id in zip(
+            range(row_count), prices, quantities, order_dates, customer_ids, strict=True
+        )
+    )
 
     # Write files
     files = {}
@@ -71,6 +80,32 @@ Lisa Garcia,29,"Engineering, Frontend",78000,lisa@company.com,2023-04-10,active"
     return temp_dir, files
 
 
+def _order_columns(batch):
+    """Split a batch of order rows into (categories, prices, quantities, customer_ids) columns.
+
+    Rows with fewer than 7 fields are dropped. Prices and quantities are converted a whole
+    column at a time; if any value fails to convert, the batch is filtered row by row so
+    that only the malformed rows are skipped.
+    """
+    rows = [row for row in batch if len(row) >= 7]
+    try:
+        prices = list(map(float, map(_PRICE, rows)))
+        quantities = list(map(int, map(_QUANTITY, rows)))
+    except ValueError:
+        return _order_columns([row for row in rows if _order_row_parses(row)])
+    return list(map(_CATEGORY, rows)), prices, quantities, list(map(_CUSTOMER_ID, rows))
+
+
+def _order_row_parses(row):
+    """Return True if the row's price and quantity fields convert cleanly."""
+    try:
+        float(row[3])
+        int(row[4])
+    except ValueError:
+        return False
+    return True
+
+
 def workflow_1_data_cleaning_and_validation(files):
     """Comprehensive data cleaning and validation workflow."""
 
@@ -81,10 +116,8 @@ def workflow_1_data_cleaning_and_validation(files):
     for row in raw_data[1:]:
         cleaned_row = []
         for i, cell in enumerate(row):
-            # Apply comprehensive text cleaning
-            clean_cell = TextNormalizer.normalize_whitespace(cell)
-            clean_cell = TextNormalizer.normalize_spaces(clean_cell)
-            clean_cell = TextNormalizer.remove_control_chars(clean_cell)
+            # Apply comprehensive text cleaning (whitespace, spaces, control characters) in one fused step
+            clean_cell = TextNormalizer.clean_all(cell)
 
             # Special handling for specific columns
             if i == 0:  # Name column
@@ -162,44 +195,27 @@ def workflow_2_streaming_data_analysis(files):
 
     # Initialize counters
     total_records = 0
-    category_counts = {}
+    category_counts = Counter()
     total_revenue = 0.0
     price_sum = 0.0
     quantity_sum = 0
     customer_ids = set()
 
-    # Process data in streaming fashion
-    chunk_count = 0
-    for row in streaming_model:
-        total_records += 1
-
-        try:
-            # Extract values (assuming row is a list)
-            if len(row) >= 7:
-                # product = row[1]  # Unused variable
-                category = row[2]
-                price = float(row[3])
-                quantity = int(row[4])
-                customer_id = row[6]
-
-                # Update statistics
-                category_counts[category] = category_counts.get(category, 0) + 1
-                revenue = price * quantity
-                total_revenue += revenue
-                price_sum += price
-                quantity_sum += quantity
-                customer_ids.add(customer_id)
-
-        except (ValueError, IndexError):
-            # Skip malformed rows
-            continue
-
-        # Report progress
-        if total_records % 1000 == 0:
-            chunk_count += 1
-
-            if chunk_count >= 5:  # Limit for demonstration
-                break
+    # Process data in streaming fashion, 1000-row batches at a time; each batch is reduced
+    # column-wise with C-level map/sum/Counter instead of updating every statistic per row
+    rows = iter(streaming_model)
+    for _chunk in range(5):  # Limit for demonstration
+        batch = list(islice(rows, 1000))
+        if not batch:
+            break
+        total_records += len(batch)
+
+        categories, prices, quantities, customers = _order_columns(batch)
+        category_counts.update(categories)
+        total_revenue += sum(map(mul, prices, quantities))
+        price_sum += sum(prices)
+        quantity_sum += sum(quantities)
+        customer_ids.update(customers)
 
     if total_records > 0:
         price_sum / total_records
@@ -319,8 +335,7 @@ def workflow_4_comprehensive_etl_pipeline(files):
 
         cleaned_row = []
         for j, cell in enumerate(row):
-            clean_cell = TextNormalizer.normalize_whitespace(cell)
-            clean_cell = TextNormalizer.normalize_spaces(clean_cell)
+            clean_cell = TextNormalizer.normalize_spaces(cell)  # Subsumes normalize_whitespace
 
             if j == 0:  # Name
                 clean_cell = CaseHelper.to_sentence(clean_cell.replace("_", " "))
@@ -217,6 +217,49 @@ class DataTransformer(DataTransformerProtocol):
         ]
         return TabularDataModel([header, *new_data])
 
+    def group_sum(
+        self,
+        group_cols: list[str],
+        value_col: str,
+        *,
+        converter: Callable[[Any], Any] = int,
+    ) -> TabularDataModel:
+        """
+        Group data by columns and sum a value column in a single pass.
+
+        Equivalent to group_by with a summing aggregation, but running totals are
+        accumulated per group while scanning, so no per-group value lists are built.
+        Groups appear in first-seen order. Each value is converted exactly once per call.
+
+        Args:
+            group_cols (List[str]): Columns to group by.
+            value_col (str): Column whose values are summed.
+            converter (Callable[[Any], Any]): Converts each raw value to a number (default: int).
+
+        Returns:
+            TabularDataModel: Grouped data model with one total per group.
+
+        Raises:
+            ValueError: If group_cols is empty, columns are invalid or a value cannot be converted.
+        """
+        if not group_cols:
+            msg = "group_cols must contain at least one column"
+            raise ValueError(msg)
+
+        for col in [*group_cols, value_col]:
+            if col not in self._model.column_names:
+                msg = f"Column {col} not found in data model"
+                raise ValueError(msg)
+
+        keys = zip(*(self._model.column_values(col) for col in group_cols), strict=True)
+        totals: dict[tuple[Any, ...], Any] = {}
+        for key, value in zip(keys, map(converter, self._model.column_values(value_col)), strict=True):
+            totals[key] = totals.get(key, 0) + value
+
+        header = [*group_cols, value_col]
+        new_data: list[list[Any]] = [[*key, str(total)] for key, total in totals.items()]
+        return TabularDataModel([header, *new_data])
+
     def transform_column(
         self,
         column: str,
@@ -244,3 +287,43 @@ class DataTransformer(DataTransformerProtocol):
             for row in self._model.iter_rows()
         ]
         return TabularDataModel([self._model.column_names, *new_data])
+
+    def transform_column_values(
+        self,
+        column: str,
+        transform_func: Callable[[list[Any]], list[Any]],
+    ) -> TabularDataModel:
+        """
+        Transform a whole column at once using a function over its values.
+
+        Unlike transform_column, transform_func is called once with the full list of
+        column values rather than once per cell, so bulk conversions can run in a single
+        comprehension or C-level map.
+
+        Args:
+            column (str): Name of column to transform.
+            transform_func (Callable[[List[Any]], List[Any]]): Function mapping the column's
+                values to a list of new values of the same length.
+
+        Returns:
+            TabularDataModel: Data model with transformed column.
+
+        Raises:
+            ValueError: If column is invalid or transform_func returns the wrong number of values.
+        """
+        if column not in self._model.column_names:
+            msg = f"Column {column} not found in data model"
+            raise ValueError(msg)
+
+        values = self._model.column_values(column)
+        new_values = list(transform_func(values))
+        if len(new_values) != len(values):
+            msg = f"transform_func returned {len(new_values)} values for {len(values)} rows"
+            raise ValueError(msg)
+
+        col_idx = self._model.column_index(column)
+        new_data: list[list[Any]] = [
+            [*row[:col_idx], str(value), *row[col_idx + 1 :]]
+            for row, value in zip(self._model, new_values, strict=True)
+        ]
+        return TabularDataModel([self._model.column_names, *new_data])
@@ -11,7 +11,7 @@ This module is licensed under the MIT License.
 """
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 from splurge_tools.protocols import DataValidatorProtocol
@@ -91,27 +91,63 @@ class DataValidator(DataValidatorProtocol):
                     return False
         return True
 
-    def _validate_dict(
+    def validate_fast(
         self,
         data: dict[str, Any],
-    ) -> bool:
-        """Validate dictionary data."""
-        is_valid = True
+    ) -> tuple[bool, list[str] | None]:
+        """
+        Validate a dictionary without touching the instance's error state.
 
-        for field, validators in self._validators.items():
-            if field not in data:
-                self._errors.append(f"Field '{field}' is required")
-                is_valid = False
-                continue
+        Applies the same rules and error messages as validate() on a dictionary,
+        but returns the errors directly instead of storing them. Valid data
+        returns (True, None), so no error list is allocated on the valid path.
+        Uses the current validators; compile() snapshots them for repeated calls.
 
-            value = data[field]
-            for validator in validators:
-                if not validator(value):
-                    self._errors.append(f"Validation failed for field '{field}'")
-                    is_valid = False
-                    break
+        Args:
+            data: Dictionary of field names and values to validate
 
-        return is_valid
+        Returns:
+            (True, None) if valid, otherwise (False, errors)
+        """
+        errors = self._dict_errors(self._validators.items(), data)
+        if errors is None:
+            return True, None
+        return False, errors
+
+    @staticmethod
+    def _dict_errors(
+        rules: Iterable[tuple[str, Iterable[Callable[[Any], bool]]]],
+        data: dict[str, Any],
+    ) -> list[str] | None:
+        """Apply (field, validators) rules to a dictionary; return the error messages, or None if all pass."""
+        errors: list[str] | None = None
+        for field, validators in rules:
+            if field not in data:
+                message = f"Field '{field}' is required"
+            else:
+                value = data[field]
+                for validator in validators:
+                    if not validator(value):
+                        break
+                else:
+                    continue
+                message = f"Validation failed for field '{field}'"
+            if errors is None:
+                errors = [message]
+            else:
+                errors.append(message)
+        return errors
+
+    def _validate_dict(
+        self,
+        data: dict[str, Any],
+    ) -> bool:
+        """Validate dictionary data."""
+        errors = self._dict_errors(self._validators.items(), data)
+        if errors is None:
+            return True
+        self._errors.extend(errors)
+        return False
 
     def _validate_list(
         self,
@@ -258,6 +294,33 @@ class DataValidator(DataValidatorProtocol):
         """
         return self._validators.get(field, []).copy()
 
+    def compile(self) -> Callable[[dict[str, Any]], tuple[bool, list[str]]]:
+        """
+        Snapshot the current field validators into a standalone dictionary validator.
+
+        The returned function applies the same rules and produces the same error
+        messages as validate() on a dictionary, but binds the (field, validators)
+        pairs once up front and does not touch this instance's error state, so it
+        can be called repeatedly in a loop without get_errors()/clear_errors().
+        Validators added after compile() are not seen by the returned function.
+
+        Returns:
+            Function taking a row dictionary and returning (is_valid, errors)
+        """
+        rules: tuple[tuple[str, tuple[Callable[[Any], bool], ...]], ...] = tuple(
+            (field, tuple(validators)) for field, validators in self._validators.items()
+        )
+
+        dict_errors = self._dict_errors
+
+        def validate_row(data: dict[str, Any]) -> tuple[bool, list[str]]:
+            errors = dict_errors(rules, data)
+            if errors is None:
+                return True, []
+            return False, errors
+
+        return validate_row
+
     @staticmethod
     def required() -> Callable[[Any], bool]:
         """Validator that checks if a value is not None or empty."""
@@ -285,6 +348,32 @@ class DataValidator(DataValidatorProtocol):
         pattern = re.compile(regex)
         return lambda x: bool(pattern.match(str(x)))
 
+    @staticmethod
+    def integer_range(
+        min_val: int,
+        max_val: int,
+    ) -> Callable[[Any], bool]:
+        """Validator that checks if a value is an unsigned decimal integer within a range.
+
+        Non-digit input is rejected by a str.isdecimal() precheck before int() is
+        called, so invalid values never raise and unwind an exception. Digit strings
+        longer than max_val (ignoring leading zeros) are rejected by length alone,
+        without converting them.
+        """
+        max_digits = len(str(max_val))
+
+        def check(x: Any) -> bool:
+            text = str(x)
+            if not text.isdecimal():
+                return False
+            if len(text) > max_digits:
+                text = text.lstrip("0") or "0"
+                if len(text) > max_digits:
+                    return False
+            return min_val <= int(text) <= max_val
+
+        return check
+
     @staticmethod
     def numeric_range(
         min_val: float,
@@ -14,15 +14,78 @@ Please preserve this header and all related material when sharing!
 This module is licensed under the MIT License.
 """
 
+import operator
 import random
 import string
 import sys
 from datetime import date, datetime, timedelta
-from secrets import randbits
+from functools import lru_cache
+from secrets import token_bytes
+from typing import Any
 
 from splurge_tools.exceptions import SplurgeFormatError, SplurgeParameterError, SplurgeRangeError
 
 
+@lru_cache(maxsize=32)
+def _ascii_byte_table(
+    chars: str,
+) -> tuple[bytes, bytes]:
+    """
+    Build (and cache) a bytes.translate table mapping random bytes onto chars.
+
+    Byte b maps to chars[b % len(chars)]; bytes at or above the largest multiple of
+    len(chars) that fits in a byte are listed for deletion, so the mapping has no bias.
+
+    Args:
+        chars: ASCII characters to map onto (at most 256)
+
+    Returns:
+        (table, rejected) arguments for bytes.translate
+    """
+    size = len(chars)
+    threshold = 256 - 256 % size
+    encoded = chars.encode("ascii")
+    table = bytes(encoded[b % size] for b in range(256))
+    return table, bytes(range(threshold, 256))
+
+
+@lru_cache(maxsize=32)
+def _base58_like_char_set(
+    base_chars: str,
+    symbols: str | None,
+    allowed_symbols: str,
+) -> str:
+    """
+    Validate symbols and build (and cache) the Base58-like character set.
+
+    Args:
+        base_chars: Base58 alphabetic and digit characters
+        symbols: Symbol characters to include (may be empty or None)
+        allowed_symbols: Characters permitted in symbols
+
+    Returns:
+        base_chars followed by symbols
+
+    Raises:
+        SplurgeFormatError: If symbols contains characters not in allowed_symbols
+    """
+    if not symbols:
+        return base_chars
+
+    invalid_chars = set(symbols) - set(allowed_symbols)
+    if invalid_chars:
+        details_parts = []
+        details_parts.append(f"Received value: {symbols!r} (type: {type(symbols).__name__})")
+        details_parts.append("Suggestions:")
+        details_parts.append(f"  - Use only characters from SYMBOLS constant: {allowed_symbols}")
+        details_parts.append(f"  - Remove invalid characters: {''.join(sorted(invalid_chars))}")
+        details = "\n".join(details_parts)
+        msg = "Invalid characters in symbols parameter"
+        raise SplurgeFormatError(msg, details=details)
+
+    return base_chars + symbols
+
+
 class RandomHelper:
     """
     A utility class for generating various types of random values.
@@ -63,7 +126,7 @@ class RandomHelper:
 
         Args:
             size (int): Number of bytes to generate
-            secure (bool, optional): If True, uses secrets.randbits() for cryptographically
+            secure (bool, optional): If True, uses secrets.token_bytes() for cryptographically
                 secure generation. If False, uses random.randbytes(). Defaults to False.
 
         Returns:
@@ -76,8 +139,8 @@ class RandomHelper:
             b'\x9a\xb2\xc3\xd4'
         """
         if secure:
-            bits: int = randbits(size * 8)
-            return bits.to_bytes(size, sys.byteorder)
+            # Read the OS CSPRNG directly; no intermediate big integer is built and converted back
+            return token_bytes(size)
         return random.randbytes(size)
 
     @classmethod
@@ -135,6 +198,60 @@ class RandomHelper:
             >>> random_int_range(1000000, 2000000, secure=True)  # Cryptographically secure
             1789012
         """
+        cls._validate_int_range(lower, upper)
+        return int(cls.as_int(secure=secure) % (upper - lower + 1)) + lower
+
+    @classmethod
+    def as_int_range_batch(
+        cls,
+        lower: int,
+        upper: int,
+        count: int,
+        *,
+        secure: bool | None = False,
+    ) -> list[int]:
+        """
+        Generate several random 64-bit integers within a specified range.
+
+        Each value is reduced from its own 64-bit word exactly as in as_int_range,
+        but the words for all values come from a single as_bytes() draw.
+
+        Args:
+            lower (int): Lower bound (inclusive)
+            upper (int): Upper bound (inclusive)
+            count (int): Number of values to generate (must be >= 1)
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            List[int]: count random integers between lower and upper (inclusive)
+
+        Raises:
+            SplurgeRangeError: If lower >= upper, the range is outside valid 64-bit bounds,
+                or count < 1
+            SplurgeParameterError: If count is not an integer
+
+        Example:
+            >>> RandomHelper.as_int_range_batch(1, 6, 5)
+            [3, 1, 6, 6, 2]
+        """
+        cls._validate_int_range(lower, upper)
+        cls._validate_count(count)
+        span = upper - lower + 1
+        return [(word & cls.INT64_MAX) % span + lower for word in cls._random_words(count, secure=secure)]
+
+    @classmethod
+    def _validate_int_range(
+        cls,
+        lower: int,
+        upper: int,
+    ) -> None:
+        """
+        Validate the bounds of an inclusive 64-bit integer range.
+
+        Raises:
+            SplurgeRangeError: If lower >= upper or range is outside valid 64-bit bounds
+        """
         if lower >= upper:
             msg = "lower must be < upper"
             raise SplurgeRangeError(
@@ -148,7 +265,28 @@ class RandomHelper:
                 msg,
                 details=f"Valid range: {cls.INT64_MIN} to {cls.INT64_MAX}",
             )
-        return int(cls.as_int(secure=secure) % (upper - lower + 1)) + lower
+
+    @classmethod
+    def _random_words(
+        cls,
+        count: int,
+        *,
+        secure: bool | None = False,
+    ) -> memoryview:
+        """
+        Draw count unsigned 64-bit words from a single as_bytes() call.
+
+        The words use the native byte order, matching how as_int() reads its bytes.
+
+        Args:
+            count (int): Number of words to draw
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            memoryview: count unsigned 64-bit integers
+        """
+        return memoryview(cls.as_bytes(8 * count, secure=secure)).cast("Q")
 
     @classmethod
     def as_float_range(
@@ -197,6 +335,159 @@ class RandomHelper:
             return lower + (random_fraction * range_size)
         return random.uniform(lower, upper)
 
+    @staticmethod
+    def _validate_count(
+        count: int,
+    ) -> None:
+        """
+        Validate the count argument of the batch generators.
+
+        Args:
+            count (int): Number of values requested
+
+        Raises:
+            SplurgeParameterError: If count is not an integer
+            SplurgeRangeError: If count < 1
+        """
+        try:
+            operator.index(count)
+        except TypeError as exc:
+            msg = f"count must be an integer, got {type(count).__name__}"
+            raise SplurgeParameterError(
+                msg,
+                details=f"Expected integer, received: {count!r}",
+            ) from exc
+
+        if count < 1:
+            msg = f"count must be >= 1, got {count}"
+            raise SplurgeRangeError(
+                msg,
+                details=f"Value {count} is below minimum allowed value 1",
+            )
+
+    @classmethod
+    def _random_indices(
+        cls,
+        count: int,
+        upper: int,
+        *,
+        secure: bool | None = False,
+    ) -> list[int]:
+        """
+        Draw count uniform random indices in [0, upper) from bulk random bytes.
+
+        Bytes are drawn in batches and those at or above the largest multiple of upper
+        that fits in a byte are rejected, so the modulo carries no bias. Ranges wider than
+        a byte fall back to one as_int_range() draw per index.
+
+        Args:
+            count (int): Number of indices to draw
+            upper (int): Exclusive upper bound (must be >= 1)
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            List[int]: count random indices
+        """
+        if upper == 1:
+            return [0] * count
+        if upper > 256:
+            return [cls.as_int_range(0, upper - 1, secure=secure) for _ in range(count)]
+
+        threshold = 256 - 256 % upper
+        indices: list[int] = []
+        while len(indices) < count:
+            needed = count - len(indices)
+            # Accept rate is at least 1/2; over-draw slightly so one batch usually suffices
+            batch = cls.as_bytes(needed + needed // 2 + 8, secure=secure)
+            indices.extend([byte % upper for byte in batch if byte < threshold])
+        del indices[count:]
+        return indices
+
+    @staticmethod
+    def _shuffle_entropy_size(
+        n: int,
+    ) -> int:
+        """Return the number of random bytes _shuffle draws for n items."""
+        if n < 2:
+            return 0
+        bits = sum(i.bit_length() for i in range(2, n + 1)) + 64
+        return (bits + 7) // 8
+
+    @classmethod
+    def _shuffle(
+        cls,
+        items: list[Any],
+        *,
+        secure: bool | None = False,
+        entropy: bytes | None = None,
+    ) -> None:
+        """
+        Shuffle items in place (Fisher-Yates) using a single random draw.
+
+        One random integer with 64 bits more than log2(len(items)!) is drawn and its
+        mixed-radix digits supply each swap index, so the bias is below 2**-64.
+
+        Args:
+            items (List[Any]): Items to shuffle in place
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+            entropy (bytes, optional): Pre-drawn random bytes of _shuffle_entropy_size(len(items))
+                to use instead of drawing new ones. Defaults to None.
+        """
+        n = len(items)
+        if n < 2:
+            return
+        if entropy is None:
+            entropy = cls.as_bytes(cls._shuffle_entropy_size(n), secure=secure)
+        value = int.from_bytes(entropy, "big")
+        for i in range(n - 1, 0, -1):
+            value, j = divmod(value, i + 1)
+            items[i], items[j] = items[j], items[i]
+
+    @classmethod
+    def as_float_range_batch(
+        cls,
+        lower: float,
+        upper: float,
+        count: int,
+        *,
+        secure: bool | None = False,
+    ) -> list[float]:
+        """
+        Generate several random floats within a specified range.
+
+        Each value scales its own 64-bit word into [lower, upper], the same way the secure
+        path of as_float_range does, but the words for all values come from one as_bytes() draw.
+
+        Args:
+            lower (float): Lower bound (inclusive)
+            upper (float): Upper bound (inclusive)
+            count (int): Number of values to generate (must be >= 1)
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            List[float]: count random floats between lower and upper
+
+        Raises:
+            SplurgeRangeError: If lower >= upper or count < 1
+            SplurgeParameterError: If count is not an integer
+
+        Example:
+            >>> RandomHelper.as_float_range_batch(0.0, 1.0, 3)
+            [0.56789, 0.01234, 0.98765]
+        """
+        if lower >= upper:
+            msg = "lower must be < upper"
+            raise SplurgeRangeError(
+                msg,
+                details=f"Got lower={lower}, upper={upper}",
+            )
+        cls._validate_count(count)
+        scale = (upper - lower) / 2**64
+        return [lower + word * scale for word in cls._random_words(count, secure=secure)]
+
     @classmethod
     def as_string(
         cls,
@@ -254,8 +545,18 @@ class RandomHelper:
                 details="Empty strings are not allowed",
             )
 
+        if allowable_chars.isascii() and len(allowable_chars) <= 256:
+            # Map and reject whole batches of random bytes in C with bytes.translate
+            table, rejected = _ascii_byte_table(allowable_chars)
+            result = b""
+            while len(result) < length:
+                needed = length - len(result)
+                batch = cls.as_bytes(needed + needed // 2 + 8, secure=secure)
+                result += batch.translate(table, rejected)
+            return result[:length].decode("ascii")
+
         return "".join(
-            [allowable_chars[cls.as_int_range(0, len(allowable_chars) - 1, secure=secure)] for _ in range(length)],
+            [allowable_chars[i] for i in cls._random_indices(length, len(allowable_chars), secure=secure)],
         )
 
     @classmethod
@@ -455,6 +756,45 @@ class RandomHelper:
             >>> RandomHelper.as_base58_like(10, symbols="@#$", secure=True)
             'A3@bC4#dE'  # Secure generation with symbols from SYMBOLS constant
         """
+        return cls.as_base58_like_batch(size, 1, symbols=symbols, secure=secure)[0]
+
+    @classmethod
+    def as_base58_like_batch(
+        cls,
+        size: int,
+        count: int,
+        *,
+        symbols: str = SYMBOLS,
+        secure: bool | None = False,
+    ) -> list[str]:
+        """
+        Generate several Base58-like strings with guaranteed character diversity.
+
+        Each string follows the same rules as as_base58_like, but the random bytes for all
+        of them are drawn in a handful of bulk calls rather than per string, which matters
+        most for secure generation where each draw reads the OS CSPRNG.
+
+        Args:
+            size (int): Length of each string to generate (must be >= 1)
+            count (int): Number of strings to generate (must be >= 1)
+            symbols (str, optional): Symbol characters to include from cls.SYMBOLS.
+                Defaults to cls.SYMBOLS. If empty or None, no symbols will be required or used.
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            List[str]: count random Base58-like strings
+
+        Raises:
+            SplurgeParameterError: If size or count is not an integer
+            SplurgeRangeError: If size or count < 1, or size is too small to satisfy
+                character requirements
+            SplurgeFormatError: If symbols contains characters not in cls.SYMBOLS
+
+        Example:
+            >>> RandomHelper.as_base58_like_batch(8, 3, symbols="")
+            ['A3bC4dEf', 'x9Yz2WvU', 'Mn7Pq8Rs']
+        """
         if not isinstance(size, int):
             msg = f"size must be an integer, got {type(size).__name__}"
             raise SplurgeParameterError(
@@ -469,18 +809,8 @@ class RandomHelper:
                 details=f"Value {size} is below minimum allowed value 1",
             )
 
-        # Validate symbols parameter
-        if symbols:
-            invalid_chars = set(symbols) - set(cls.SYMBOLS)
-            if invalid_chars:
-                details_parts = []
-                details_parts.append(f"Received value: {symbols!r} (type: {type(symbols).__name__})")
-                details_parts.append("Suggestions:")
-                details_parts.append(f"  - Use only characters from SYMBOLS constant: {cls.SYMBOLS}")
-                details_parts.append(f"  - Remove invalid characters: {''.join(sorted(invalid_chars))}")
-                details = "\n".join(details_parts)
-                msg = "Invalid characters in symbols parameter"
-                raise SplurgeFormatError(msg, details=details)
+        # Validate symbols and build the character set once per distinct configuration
+        char_set = _base58_like_char_set(cls.BASE58_ALPHA + cls.BASE58_DIGITS, symbols, cls.SYMBOLS)
 
         # Determine required character types
         use_symbols = symbols and len(symbols) > 0
@@ -493,40 +823,29 @@ class RandomHelper:
                 details += ", and symbol"
             raise SplurgeRangeError(message, details=details)
 
-        # Build character set
-        char_set = cls.BASE58_ALPHA + cls.BASE58_DIGITS
-        if use_symbols:
-            char_set += symbols
-
-        # Generate string with guaranteed diversity
-        result = []
-
-        # Add required characters
-        alpha_idx = cls.as_int_range(0, len(cls.BASE58_ALPHA) - 1, secure=secure)
-        result.append(cls.BASE58_ALPHA[alpha_idx])  # At least one alpha
-
-        digit_idx = cls.as_int_range(0, len(cls.BASE58_DIGITS) - 1, secure=secure)
-        result.append(cls.BASE58_DIGITS[digit_idx])  # At least one digit
-
-        if use_symbols:
-            if len(symbols) == 1:
-                result.append(symbols[0])  # Only one symbol available
-            else:
-                symbol_idx = cls.as_int_range(0, len(symbols) - 1, secure=secure)
-                result.append(symbols[symbol_idx])  # At least one symbol
+        cls._validate_count(count)
 
-        # Fill remaining positions randomly from full character set
-        remaining = size - len(result)
-        for _ in range(remaining):
-            char_idx = cls.as_int_range(0, len(char_set) - 1, secure=secure)
-            result.append(char_set[char_idx])
-
-        # Shuffle to avoid predictable patterns (Fisher-Yates shuffle)
-        for i in range(len(result) - 1, 0, -1):
-            j = cls.as_int_range(0, i, secure=secure)
-            result[i], result[j] = result[j], result[i]
-
-        return "".join(result)
+        # Draw every string's required characters, fill and shuffle entropy in bulk
+        alphas = cls.as_string(count, cls.BASE58_ALPHA, secure=secure)  # At least one alpha
+        digits = cls.as_string(count, cls.BASE58_DIGITS, secure=secure)  # At least one digit
+        # At least one symbol (as_string handles a single available symbol)
+        required = (
+            zip(alphas, digits, cls.as_string(count, symbols, secure=secure), strict=True)
+            if use_symbols
+            else zip(alphas, digits, strict=True)
+        )
+        remaining = size - min_required
+        fill = cls.as_string(count * remaining, char_set, secure=secure) if remaining else ""
+        shuffle_size = cls._shuffle_entropy_size(size)
+        entropy = cls.as_bytes(count * shuffle_size, secure=secure)
+
+        # Fill remaining positions from the full character set, then shuffle to avoid predictable patterns
+        results: list[str] = []
+        for k, chars in enumerate(required):
+            result = [*chars, *fill[k * remaining : (k + 1) * remaining]]
+            cls._shuffle(result, entropy=entropy[k * shuffle_size : (k + 1) * shuffle_size])
+            results.append("".join(result))
+        return results
 
     @classmethod
     def as_variable_base58(
@@ -669,6 +988,30 @@ class RandomHelper:
         """
         return cls.as_int_range(0, 1, secure=secure) == 1
 
+    @classmethod
+    def as_bool_batch(
+        cls,
+        count: int,
+        *,
+        secure: bool | None = False,
+    ) -> list[bool]:
+        """
+        Generate several random boolean values from a single random draw.
+
+        Args:
+            count (int): Number of values to generate (must be >= 1)
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            List[bool]: count random boolean values
+
+        Example:
+            >>> RandomHelper.as_bool_batch(3)
+            [True, False, False]
+        """
+        return [value == 1 for value in cls.as_int_range_batch(0, 1, count, secure=secure)]
+
     @classmethod
     def as_masked_string(
         cls,
@@ -856,6 +1199,43 @@ class RandomHelper:
             days=cls.as_int_range(lower_days, upper_days, secure=secure),
         )
 
+    @classmethod
+    def as_date_batch(
+        cls,
+        lower_days: int,
+        upper_days: int,
+        count: int,
+        *,
+        base_date: date | None = None,
+        secure: bool | None = False,
+    ) -> list[date]:
+        """
+        Generate several random dates between two days.
+
+        Day offsets are drawn with as_int_range_batch and added to the base date's
+        ordinal, so today's date is looked up once and no timedelta is built per date.
+
+        Args:
+            lower_days (int): Minimum number of days from the base date
+            upper_days (int): Maximum number of days from the base date
+            count (int): Number of dates to generate (must be >= 1)
+            base_date (date, optional): Base date to use for generation. Defaults to today.
+            secure (bool, optional): If True, uses cryptographically secure random generation.
+                Defaults to False.
+
+        Returns:
+            List[datetime.date]: count random dates between the two days
+
+        Example:
+            >>> RandomHelper.as_date_batch(0, 30, 2)
+            [datetime.date(2025, 6, 16), datetime.date(2025, 6, 3)]
+        """
+        ordinal = (base_date if base_date else date.today()).toordinal()
+        return [
+            date.fromordinal(ordinal + offset)
+            for offset in cls.as_int_range_batch(lower_days, upper_days, count, secure=secure)
+        ]
+
     @classmethod
     def as_datetime(
         cls,
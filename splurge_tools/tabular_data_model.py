@@ -8,7 +8,7 @@ Please preserve this header and all related material when sharing!
 This module is licensed under the MIT License.
 """
 
-from collections.abc import Generator, Iterator
+from collections.abc import Generator, Iterator, Sequence
 from typing import Any
 
 from splurge_tools.common_utils import safe_dict_access, validate_data_structure
@@ -61,28 +61,116 @@ class TabularDataModel(TabularDataProtocol):
                 details=f"Value {header_rows} is below minimum allowed value 0",
             )
 
-        self._raw_data = data
-        self._header_rows = header_rows
-        self._header_data = data[:header_rows] if header_rows > 0 else []
-        self._data = (
+        raw_header_data = data[:header_rows] if header_rows > 0 else []
+        rows = (
             self._normalize_data_model(data[header_rows:], skip_empty_rows)
             if header_rows > 0
             else self._normalize_data_model(data, skip_empty_rows)
         )
-        self._header_columns = len(self._header_data[0]) if len(self._header_data) > 0 else 0
-        self._columns = len(self._data[0]) if len(self._data) > 0 else 0
-        self._rows = max(0, len(self._data))
+        column_count = len(rows[0]) if len(rows) > 0 else 0
 
         # Process headers using shared utility
-        self._header_data, self._column_names = _process_headers(
-            self._header_data,
+        header_data, column_names = _process_headers(
+            raw_header_data,
             header_rows=header_rows,
         )
 
         # Ensure column names match the actual column count
-        while len(self._column_names) < self._columns:
-            self._column_names.append(f"column_{len(self._column_names)}")
-        self._column_index_map = {name: i for i, name in enumerate(self._column_names)}
+        while len(column_names) < column_count:
+            column_names.append(f"column_{len(column_names)}")
+
+        self._initialize(
+            raw_data=data,
+            header_rows=header_rows,
+            header_data=header_data,
+            header_columns=len(raw_header_data[0]) if len(raw_header_data) > 0 else 0,
+            column_names=column_names,
+            rows=rows,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        column_names: list[str],
+        columns: list[list[str]],
+    ) -> "TabularDataModel":
+        """
+        Build a model from column-oriented data with a known schema.
+
+        Column names are used as given and rows are assembled by transposing the
+        columns once, so header merging, row padding and empty-row detection are skipped.
+
+        Args:
+            column_names (list[str]): Column names, one per column.
+            columns (list[list[str]]): Column values; all columns must have the same length.
+
+        Returns:
+            TabularDataModel: Model whose rows are the transposed columns.
+
+        Raises:
+            SplurgeParameterError: If the number of names and columns differ or the columns differ in length.
+        """
+        if len(column_names) != len(columns):
+            msg = f"Expected {len(column_names)} columns, got {len(columns)}"
+            raise SplurgeParameterError(
+                msg,
+                details="column_names and columns must have the same length",
+            )
+
+        row_count = len(columns[0]) if columns else 0
+        if any(len(column) != row_count for column in columns):
+            msg = "All columns must have the same number of values"
+            raise SplurgeParameterError(
+                msg,
+                details=f"Column lengths: {[len(column) for column in columns]}",
+            )
+
+        header = list(column_names)
+        rows = [list(row) for row in zip(*columns, strict=True)]
+        model = cls.__new__(cls)
+        model._initialize(
+            raw_data=[header, *rows],
+            header_rows=1,
+            header_data=[header],
+            header_columns=len(header),
+            column_names=header,
+            rows=rows,
+        )
+        return model
+
+    def _initialize(
+        self,
+        *,
+        raw_data: list[list[str]],
+        header_rows: int,
+        header_data: list[list[str]],
+        header_columns: int,
+        column_names: list[str],
+        rows: list[list[str]],
+    ) -> None:
+        """
+        Set the model state from processed headers and normalized rows.
+
+        Shared by __init__ and from_columns so every construction path sets up the
+        same attributes.
+
+        Args:
+            raw_data (list[list[str]]): Rows as supplied, including header rows.
+            header_rows (int): Number of header rows in raw_data.
+            header_data (list[list[str]]): Processed header rows.
+            header_columns (int): Number of columns in the first raw header row.
+            column_names (list[str]): Final column names, one per column.
+            rows (list[list[str]]): Normalized data rows of equal length.
+        """
+        self._raw_data = raw_data
+        self._header_rows = header_rows
+        self._header_data = header_data
+        self._header_columns = header_columns
+        self._data = rows
+        self._columns = len(rows[0]) if len(rows) > 0 else 0
+        self._rows = len(rows)
+        self._column_names = column_names
+        self._column_index_map = {name: i for i, name in enumerate(column_names)}
         self._column_types: dict[str, DataType] = {}
 
     # Removed local process_headers; logic is shared in splurge_tools.tabular_utils
@@ -220,6 +308,36 @@ class TabularDataModel(TabularDataProtocol):
         for row in self._data:
             yield tuple(row)
 
+    def itertuples(
+        self,
+        fields: Sequence[str] | None = None,
+    ) -> Generator[tuple[str, ...], None, None]:
+        """
+        Iterate over rows as tuples, optionally restricted to selected columns.
+
+        With fields, only the named columns are extracted (in the given order) and
+        zipped back into rows, so no per-row dictionary is built and unused columns
+        are never copied. An empty fields sequence yields one empty tuple per row.
+
+        Args:
+            fields (Sequence[str] | None): Column names to include (default: all columns).
+
+        Yields:
+            tuple[str, ...]: Row values for the selected columns.
+
+        Raises:
+            SplurgeParameterError: If a field name is not found.
+        """
+        if fields is None:
+            yield from map(tuple, self._data)
+            return
+        indices = [self.column_index(name) for name in fields]
+        if not indices:
+            for _ in range(self._rows):
+                yield ()
+            return
+        yield from zip(*([row[col_idx] for row in self._data] for col_idx in indices), strict=True)
+
     def row(
         self,
         index: int,
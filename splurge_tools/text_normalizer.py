@@ -10,6 +10,7 @@ This module is licensed under the MIT License.
 
 import re
 import unicodedata
+from functools import lru_cache
 from re import Pattern
 from typing import Any
 
@@ -17,6 +18,42 @@ from splurge_tools.case_helper import CaseHelper
 from splurge_tools.common_utils import safe_string_operation
 from splurge_tools.decorators import handle_empty_value, handle_empty_value_classmethod
 
+_LINE_ENDINGS_PATTERN: Pattern[str] = re.compile(r"\r\n|\r|\n")
+_APOSTROPHE_PATTERN: Pattern[str] = re.compile(r"(\w)'(\w)")
+_DASHES_PATTERN: Pattern[str] = re.compile(r"[–—]")
+
+
+@lru_cache(maxsize=32)
+def _special_chars_pattern(
+    keep_chars: str,
+) -> Pattern[str]:
+    """
+    Compile (and cache) the pattern matching special characters not in keep_chars.
+
+    Args:
+        keep_chars: Additional characters to preserve
+
+    Returns:
+        Compiled pattern for remove_special_chars
+    """
+    return re.compile(f"[^\\w\\s{re.escape(keep_chars)}]")
+
+
+@lru_cache(maxsize=32)
+def _duplicate_chars_pattern(
+    chars: str,
+) -> Pattern[str]:
+    """
+    Compile (and cache) a single pattern matching runs of any of the given characters.
+
+    Args:
+        chars: String of characters to deduplicate
+
+    Returns:
+        Compiled pattern whose first group is the repeated character
+    """
+    return re.compile(f"([{re.escape(chars)}])\\1+")
+
 
 class TextNormalizer:
     """
@@ -41,6 +78,12 @@ class TextNormalizer:
 
     _WHITESPACE_PATTERN: Pattern[str] = re.compile(r"\s+")
     _CONTROL_CHARS_PATTERN: Pattern[str] = re.compile(r"[\x00-\x1f\x7f-\x9f]")
+    _CONTROL_CHARS_TABLE: dict[int, None] = dict.fromkeys([*range(0x00, 0x20), *range(0x7F, 0xA0)])
+    _INLINE_WHITESPACE_PATTERN: Pattern[str] = re.compile(r"[^\S\n]+")
+    _CARRIAGE_RETURN_PATTERN: Pattern[str] = re.compile(r"\r\n|\r")
+    _BLANK_LINES_PATTERN: Pattern[str] = re.compile(r"\n\s*\n")
+    _TRAILING_SPACES_PATTERN: Pattern[str] = re.compile(r" +(\n)")
+    _LEADING_SPACES_PATTERN: Pattern[str] = re.compile(r"(\n) +")
 
     @staticmethod
     @handle_empty_value
@@ -60,6 +103,9 @@ class TextNormalizer:
             "café" -> "cafe"
             "résumé" -> "resume"
         """
+        # Pure ASCII text has no decomposable characters, so skip NFKD entirely
+        if value.isascii():
+            return value
         return "".join(c for c in unicodedata.normalize("NFKD", value) if not unicodedata.combining(c))
 
     @classmethod
@@ -85,11 +131,11 @@ class TextNormalizer:
             "hello\n\nworld" -> "hello world" (if preserve_newlines=False)
         """
         if preserve_newlines:
-            value = re.sub(r"[^\S\n]+", " ", value)
-            value = re.sub(r"\r\n|\r", "\n", value)
-            value = re.sub(r"\n\s*\n", "\n\n", value)
-            value = re.sub(r" +(\n)", r"\1", value)
-            value = re.sub(r"(\n) +", r"\1", value)
+            value = cls._INLINE_WHITESPACE_PATTERN.sub(" ", value)
+            value = cls._CARRIAGE_RETURN_PATTERN.sub("\n", value)
+            value = cls._BLANK_LINES_PATTERN.sub("\n\n", value)
+            value = cls._TRAILING_SPACES_PATTERN.sub(r"\1", value)
+            value = cls._LEADING_SPACES_PATTERN.sub(r"\1", value)
         else:
             value = cls._WHITESPACE_PATTERN.sub(" ", value)
         return value.strip()
@@ -115,8 +161,7 @@ class TextNormalizer:
             "hello@world!" -> "helloworld"
             "hello@world!" (keep_chars="@") -> "hello@world"
         """
-        pattern: str = f"[^\\w\\s{re.escape(keep_chars)}]"
-        return re.sub(pattern, "", value)
+        return _special_chars_pattern(keep_chars).sub("", value)
 
     @staticmethod
     @handle_empty_value
@@ -138,7 +183,7 @@ class TextNormalizer:
         Example:
             "hello\r\nworld" -> "hello\nworld"
         """
-        return re.sub(r"\r\n|\r|\n", line_ending, value)
+        return _LINE_ENDINGS_PATTERN.sub(line_ending, value)
 
     @classmethod
     @handle_empty_value_classmethod
@@ -183,8 +228,35 @@ class TextNormalizer:
         Example:
             "hello\x00world" -> "helloworld"
         """
+        # str.translate has a C fast path for ASCII input; the regex is faster for everything else
+        if value.isascii():
+            return value.translate(cls._CONTROL_CHARS_TABLE)
         return cls._CONTROL_CHARS_PATTERN.sub("", value)
 
+    @classmethod
+    @handle_empty_value_classmethod
+    def clean_all(
+        cls,
+        value: str,
+    ) -> str:
+        """
+        Collapse whitespace and remove control characters in one fused step.
+
+        Equivalent to remove_control_chars(normalize_spaces(normalize_whitespace(value))),
+        but str.split() already collapses every whitespace run and trims the ends, so a
+        single split/join and one translate replace the three separate passes.
+
+        Args:
+            value: Input string to normalize
+
+        Returns:
+            String with single spaces between words and no control characters
+
+        Example:
+            "  hello\t\x00world  " -> "hello world"
+        """
+        return " ".join(value.split()).translate(cls._CONTROL_CHARS_TABLE)
+
     @staticmethod
     @handle_empty_value
     def normalize_quotes(
@@ -207,7 +279,10 @@ class TextNormalizer:
             "hello 'world'" -> 'hello "world"'
             "hello 'world's" -> 'hello "world's"'
         """
-        temp: str = re.sub(r"(\w)'(\w)", r"\1§APOS§\2", value)
+        # Nothing to rewrite when there are no single quotes and double quotes are already the target
+        if "'" not in value and ('"' not in value or quote_char == '"'):
+            return value
+        temp: str = _APOSTROPHE_PATTERN.sub(r"\1§APOS§\2", value)
         temp = temp.replace('"', quote_char).replace("'", quote_char)
         result: str = temp.replace("§APOS§", "'")
         return result
@@ -233,7 +308,7 @@ class TextNormalizer:
             "hello–world" -> "hello-world"
             "hello—world" -> "hello-world"
         """
-        return re.sub(r"[–—]", dash_char, value)
+        return _DASHES_PATTERN.sub(dash_char, value)
 
     @staticmethod
     @handle_empty_value
@@ -308,11 +383,9 @@ class TextNormalizer:
             "hello--world" -> "hello-world"
             "hello...world" (chars='.') -> "hello.world"
         """
-        result: str = value
-        for char in chars:
-            pattern: str = f"{re.escape(char)}{{2,}}"
-            result = re.sub(pattern, char, result)
-        return result
+        if not chars:
+            return value
+        return _duplicate_chars_pattern(chars).sub(r"\1", value)
 
     @classmethod
     def safe_normalize(
@@ -164,6 +164,48 @@ class TestTabularDataModel:
         assert rows[1] == ("Jane", "25", "Boston")
         assert rows[2] == ("Bob", "35", "Chicago")
 
+    def test_itertuples(self):
+        """Test tuple iteration with optional column selection."""
+        model = TabularDataModel(self.sample_data)
+        assert list(model.itertuples()) == list(model.iter_rows_as_tuples())
+        assert list(model.itertuples(["City", "Name"])) == [
+            ("New York", "John"),
+            ("Boston", "Jane"),
+            ("Chicago", "Bob"),
+        ]
+        assert list(model.itertuples(["Age"])) == [("30",), ("25",), ("35",)]
+        assert list(model.itertuples([])) == [(), (), ()]
+
+        with pytest.raises(SplurgeParameterError):
+            list(model.itertuples(["InvalidColumn"]))
+
+    def test_from_columns(self):
+        """Test building a model from column-oriented data."""
+        model = TabularDataModel.from_columns(
+            ["Name", "Age", "City"],
+            [["John", "Jane", "Bob"], ["30", "25", "35"], ["New York", "Boston", "Chicago"]],
+        )
+        expected = TabularDataModel(self.sample_data)
+        assert model.column_names == expected.column_names
+        assert model.row_count == 3
+        assert model.column_count == 3
+        assert list(model) == list(expected)
+        assert model.row(1) == {"Name": "Jane", "Age": "25", "City": "Boston"}
+        assert model.column_type("Age") == DataType.INTEGER
+
+        # Names are used as given, without header whitespace normalization
+        assert TabularDataModel.from_columns(["First  Name"], [["John"]]).column_names == ["First  Name"]
+
+        # Empty rows are kept so no column value is dropped
+        sparse = TabularDataModel.from_columns(["Name", "Age"], [["John", ""], ["30", ""]])
+        assert sparse.row_count == 2
+        assert sparse.row(1) == {"Name": "", "Age": ""}
+
+        with pytest.raises(SplurgeParameterError):
+            TabularDataModel.from_columns(["Name", "Age"], [["John"]])
+        with pytest.raises(SplurgeParameterError):
+            TabularDataModel.from_columns(["Name", "Age"], [["John", "Jane"], ["30"]])
+
     def test_column_type(self):
         """Test column type inference."""
         model = TabularDataModel(self.mixed_type_data)
@@ -101,6 +101,46 @@ class TestDataTransformer:
         john_row = next(row for row in rows if row["Name"] == "John")
         assert float(john_row["Value"]) == 15.0  # (10 + 20) / 2
 
+    def test_group_sum(self):
+        """Test single-pass group sum."""
+        result = self.transformer.group_sum(["Name"], "Value")
+        assert result.column_names == ["Name", "Value"]
+        assert list(result.iter_rows_as_tuples()) == [("John", "30"), ("Jane", "40"), ("Bob", "34")]
+
+        expected = self.transformer.group_by(
+            group_cols=["Name"],
+            agg_dict={"Value": lambda values: sum(int(v) for v in values)},
+        )
+        assert list(result) == list(expected)
+
+        result = self.transformer.group_sum(["Date", "Category"], "Value", converter=float)
+        assert list(result.iter_rows_as_tuples()) == [
+            ("2024-01-01", "A", "25.0"),
+            ("2024-01-01", "B", "45.0"),
+            ("2024-01-02", "A", "12.0"),
+            ("2024-01-02", "B", "22.0"),
+        ]
+
+        with pytest.raises(ValueError, match="not found"):
+            self.transformer.group_sum(["Name"], "Missing")
+        with pytest.raises(ValueError, match="group_cols"):
+            self.transformer.group_sum([], "Value")
+
+    def test_group_sum_converts_each_value_once(self):
+        """Test each call converts every value exactly once."""
+        calls = []
+
+        def to_int(value):
+            calls.append(value)
+            return int(value)
+
+        first = self.transformer.group_sum(["Name"], "Value", converter=to_int)
+        assert calls == ["10", "20", "15", "25", "12", "22"]
+        second = self.transformer.group_sum(["Category"], "Value", converter=to_int)
+        assert len(calls) == 12
+        assert list(first.iter_rows_as_tuples())[0] == ("John", "30")
+        assert list(second.iter_rows_as_tuples()) == [("A", "37"), ("B", "67")]
+
     def test_transform_column(self):
         """Test column transformation."""
         # Double the Value column
@@ -116,6 +156,26 @@ class TestDataTransformer:
         # Check first row
         assert rows[0]["Value"] == "20.0"  # 10 * 2
 
+    def test_transform_column_values(self):
+        """Test whole-column transformation."""
+        result = self.transformer.transform_column_values(
+            column="Value",
+            transform_func=lambda values: [float(v) * 2 for v in values],
+        )
+
+        rows = list(result.iter_rows())
+        assert len(rows) == 6
+        assert [row["Value"] for row in rows] == ["20.0", "40.0", "30.0", "50.0", "24.0", "44.0"]
+        assert rows[0]["Name"] == "John"
+        assert rows[0]["Date"] == "2024-01-01"
+
+    def test_transform_column_values_errors(self):
+        """Test whole-column transformation error handling."""
+        with pytest.raises(ValueError, match="not found"):
+            self.transformer.transform_column_values("Missing", lambda values: values)
+        with pytest.raises(ValueError, match="returned 1 values for 6 rows"):
+            self.transformer.transform_column_values("Value", lambda values: values[:1])
+
     def test_pivot_with_duplicates(self):
         """Test pivot operation with duplicate values."""
         # Test that pivot raises error when duplicates are found without agg_func
@@ -351,6 +351,52 @@ class TestDataValidatorComprehensive:
         assert len(non_existent_validators) == 0
         assert isinstance(non_existent_validators, list)
 
+    def test_compile(self):
+        """Test compiled validator matches validate() without touching error state."""
+        self.validator.add_validator("name", lambda x: bool(x))
+        self.validator.add_validator("age", lambda x: x.isdigit())
+        self.validator.add_validator("age", lambda x: int(x) >= 18)
+        validate_row = self.validator.compile()
+
+        assert validate_row({"name": "John", "age": "30"}) == (True, [])
+
+        data = {"name": "", "age": "12"}
+        is_valid, errors = validate_row(data)
+        assert not is_valid
+        assert errors == ["Validation failed for field 'name'", "Validation failed for field 'age'"]
+        assert self.validator.validate(data) is False
+        assert self.validator.get_errors() == errors
+
+        self.validator.clear_errors()
+        assert validate_row({"name": "John"}) == (False, ["Field 'age' is required"])
+        assert self.validator.get_errors() == []
+
+        # Validators added later are not part of the snapshot
+        self.validator.add_validator("email", lambda x: "@" in x)
+        assert validate_row({"name": "John", "age": "30"}) == (True, [])
+
+    def test_validate_fast(self):
+        """Test validate_fast returns errors directly and leaves error state alone."""
+        self.validator.add_validator("name", lambda x: bool(x))
+        self.validator.add_validator("age", lambda x: x.isdigit())
+
+        assert self.validator.validate_fast({"name": "John", "age": "30"}) == (True, None)
+
+        data = {"name": "", "age": "abc"}
+        is_valid, errors = self.validator.validate_fast(data)
+        assert not is_valid
+        assert errors == ["Validation failed for field 'name'", "Validation failed for field 'age'"]
+        assert self.validator.get_errors() == []
+
+        assert self.validator.validate_fast({"name": "John"}) == (False, ["Field 'age' is required"])
+
+        self.validator.validate(data)
+        assert self.validator.get_errors() == errors
+
+        # Unlike compile(), validate_fast sees validators added later
+        self.validator.add_validator("email", lambda x: "@" in x)
+        assert self.validator.validate_fast({"name": "John", "age": "30"}) == (False, ["Field 'email' is required"])
+
     def test_static_validator_methods(self):
         """Test static validator methods."""
         # Test required validator
@@ -396,6 +442,24 @@ class TestDataValidatorComprehensive:
         with pytest.raises(ValueError):
             range_validator("abc")
 
+        # Test integer_range validator
+        int_range_validator = DataValidator.integer_range(18, 65)
+        assert int_range_validator("18")
+        assert int_range_validator("65")
+        assert int_range_validator(30)
+        assert not int_range_validator("17")
+        assert not int_range_validator("66")
+        # Non-integer input is rejected rather than raising
+        assert not int_range_validator("abc")
+        assert not int_range_validator("")
+        assert not int_range_validator("-20")
+        assert not int_range_validator("30.5")
+        assert not int_range_validator("²")
+        # Leading zeros are allowed; oversized digit strings are rejected without converting
+        assert int_range_validator("00030")
+        assert not int_range_validator("0000")
+        assert not int_range_validator("9" * 10000)
+
     def test_edge_cases(self):
         """Test various edge cases."""
         # Test with empty dict
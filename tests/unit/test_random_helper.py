@@ -111,6 +111,24 @@ class TestRandomHelper:
         with pytest.raises(SplurgeRangeError):
             RandomHelper.as_int_range(1, RandomHelper.INT64_MAX + 1)  # above max
 
+    def test_as_int_range_batch(self):
+        """Test batched random integer range generation."""
+        for secure in (False, True):
+            values = RandomHelper.as_int_range_batch(1, 6, 500, secure=secure)
+            assert len(values) == 500
+            assert set(values) == {1, 2, 3, 4, 5, 6}
+
+        assert all(-5 <= v <= -1 for v in RandomHelper.as_int_range_batch(-5, -1, 50))
+
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_int_range_batch(10, 1, 5)
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_int_range_batch(1, RandomHelper.INT64_MAX + 1, 5)
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_int_range_batch(1, 10, 0)
+        with pytest.raises(SplurgeParameterError):
+            RandomHelper.as_int_range_batch(1, 10, 2.5)
+
     def test_as_float_range(self):
         """Test random float range generation."""
         # Test normal range
@@ -125,6 +143,19 @@ class TestRandomHelper:
         with pytest.raises(SplurgeRangeError):
             RandomHelper.as_float_range(1.0, 0.0)  # lower > upper
 
+    def test_as_float_range_batch(self):
+        """Test batched random float range generation."""
+        for secure in (False, True):
+            values = RandomHelper.as_float_range_batch(-1.0, 1.0, 500, secure=secure)
+            assert len(values) == 500
+            assert all(-1.0 <= value <= 1.0 for value in values)
+            assert min(values) < 0.0 < max(values)
+
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_float_range_batch(1.0, 0.0, 5)
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_float_range_batch(0.0, 1.0, 0)
+
     def test_as_string(self):
         """Test random string generation."""
         # Test with custom charset
@@ -277,6 +308,14 @@ class TestRandomHelper:
             RandomHelper.as_base58_like(5, symbols="A1!")  # A and 1 are from BASE58, not SYMBOLS
         assert "Invalid characters in symbols parameter" in str(cm.value)
 
+    def test_as_base58_like_symbols_validated_on_every_call(self):
+        """Cached character sets must not let invalid symbols through on repeat calls."""
+        for _ in range(3):
+            result = RandomHelper.as_base58_like(8, symbols="!@")
+            assert all(c in RandomHelper.BASE58_CHARS + "!@" for c in result)
+            with pytest.raises(SplurgeFormatError):
+                RandomHelper.as_base58_like(8, symbols="!X")
+
     def test_as_base58_like_constants_validation(self):
         """Test that the method correctly uses the updated constants."""
         # Verify BASE58_ALPHA and BASE58_DIGITS are used correctly
@@ -294,6 +333,67 @@ class TestRandomHelper:
             f"Result '{result}' should not contain excluded characters: {excluded_chars}"
         )
 
+    def test_as_string_bulk_paths(self):
+        """ASCII alphabets use the translate path; others fall back to per-index draws."""
+        for secure in (False, True):
+            value = RandomHelper.as_string(2000, "xyz", secure=secure)
+            assert len(value) == 2000
+            assert set(value) == set("xyz")
+
+        assert RandomHelper.as_string(10, "q") == "q" * 10
+
+        unicode_value = RandomHelper.as_string(500, "äöü")
+        assert len(unicode_value) == 500
+        assert set(unicode_value) == set("äöü")
+
+    def test_as_base58_like_batch(self):
+        """Batch generation yields count strings that each satisfy the diversity guarantee."""
+        for symbols, secure in (("", False), ("!@", True), ("#", False)):
+            results = RandomHelper.as_base58_like_batch(12, 25, symbols=symbols, secure=secure)
+            assert len(results) == 25
+            for result in results:
+                assert len(result) == 12
+                assert set(result) & set(RandomHelper.BASE58_ALPHA)
+                assert set(result) & set(RandomHelper.BASE58_DIGITS)
+                assert set(result) <= set(RandomHelper.BASE58_CHARS + symbols)
+                if symbols:
+                    assert set(result) & set(symbols)
+
+        # Minimum size: exactly one character from each required class
+        result = RandomHelper.as_base58_like_batch(3, 1, symbols="!")[0]
+        assert len(result) == 3
+        assert "!" in result
+
+    def test_as_base58_like_batch_error_conditions(self):
+        """Batch generation validates count as well as the as_base58_like arguments."""
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_base58_like_batch(10, 0)
+        with pytest.raises(SplurgeParameterError):
+            RandomHelper.as_base58_like_batch(10, "3")
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_base58_like_batch(2, 5)
+        with pytest.raises(SplurgeFormatError):
+            RandomHelper.as_base58_like_batch(10, 5, symbols="XYZ")
+
+    def test_random_indices(self):
+        """Bulk-drawn indices stay in range for byte-sized and wider alphabets."""
+        for upper in (1, 2, 3, 58, 256, 300):
+            for secure in (False, True):
+                indices = RandomHelper._random_indices(500, upper, secure=secure)
+                assert len(indices) == 500
+                assert all(0 <= i < upper for i in indices)
+        # Every value of a small range is reachable
+        assert set(RandomHelper._random_indices(500, 3)) == {0, 1, 2}
+
+    def test_shuffle_preserves_items(self):
+        """Shuffling permutes items in place without losing or duplicating any."""
+        items = list(range(50))
+        RandomHelper._shuffle(items, secure=True)
+        assert sorted(items) == list(range(50))
+        single = ["a"]
+        RandomHelper._shuffle(single)
+        assert single == ["a"]
+
     def test_as_variable_string(self):
         """Test variable length string generation."""
         # Test normal range
@@ -322,6 +422,16 @@ class TestRandomHelper:
         secure_value = RandomHelper.as_bool(secure=True)
         assert isinstance(secure_value, bool)
 
+    def test_as_bool_batch(self):
+        """Test batched random boolean generation."""
+        for secure in (False, True):
+            values = RandomHelper.as_bool_batch(200, secure=secure)
+            assert len(values) == 200
+            assert set(values) == {True, False}
+
+        with pytest.raises(SplurgeRangeError):
+            RandomHelper.as_bool_batch(0)
+
     def test_as_masked_string(self):
         """Test masked string generation."""
         # Test with digits and letters
@@ -371,6 +481,17 @@ class TestRandomHelper:
         with pytest.raises(SplurgeRangeError):
             RandomHelper.as_sequenced_string(1000, 3)  # sequence too long for digits
 
+    def test_as_date_batch(self):
+        """Test batched random date generation."""
+        values = RandomHelper.as_date_batch(0, 30, 50)
+        assert len(values) == 50
+        assert all(self.today <= value <= self.today + timedelta(days=30) for value in values)
+
+        base_date = date(2024, 1, 1)
+        values = RandomHelper.as_date_batch(-10, 10, 50, base_date=base_date, secure=True)
+        assert all(type(value) is date for value in values)
+        assert all(base_date - timedelta(days=10) <= value <= base_date + timedelta(days=10) for value in values)
+
     def test_as_date(self):
         """Test random date generation."""
         # Test non-secure mode
@@ -92,3 +92,45 @@ class TestTextNormalizer:
 
         # Test with no duplicates
         assert TextNormalizer.remove_duplicate_chars("hello world") == "hello world"
+
+    def test_remove_special_chars_with_regex_metacharacters(self):
+        assert TextNormalizer.remove_special_chars("a]b^c-d\\e!", keep_chars="]^-\\") == "a]b^c-d\\e"
+        # Repeated calls with the same keep_chars reuse the cached pattern
+        assert TextNormalizer.remove_special_chars("x@y#z", keep_chars="@") == "x@yz"
+        assert TextNormalizer.remove_special_chars("x@y#z", keep_chars="@") == "x@yz"
+
+    def test_remove_duplicate_chars_mixed_runs(self):
+        assert TextNormalizer.remove_duplicate_chars("a  --..b", chars=" -.") == "a -.b"
+        assert TextNormalizer.remove_duplicate_chars("a]]b^^c", chars="]^") == "a]b^c"
+        assert TextNormalizer.remove_duplicate_chars("a--b", chars="") == "a--b"
+
+    def test_normalize_line_endings_custom_line_ending(self):
+        assert TextNormalizer.normalize_line_endings("a\r\nb\rc\nd", line_ending="|") == "a|b|c|d"
+
+    def test_remove_accents_ascii_fast_path(self):
+        value = "plain ascii text 123"
+        assert TextNormalizer.remove_accents(value) is value
+        assert TextNormalizer.remove_accents("naïve café") == "naive cafe"
+
+    def test_normalize_quotes_fast_path(self):
+        value = 'no single quotes "here"'
+        assert TextNormalizer.normalize_quotes(value) is value
+        assert TextNormalizer.normalize_quotes('say "hi"', quote_char="'") == "say 'hi'"
+
+    def test_clean_all(self):
+        assert TextNormalizer.clean_all("  hello\t\x00world  ") == "hello world"
+        assert TextNormalizer.clean_all("a\x01b\u00a0\u2003c\x85") == "ab c"
+        assert TextNormalizer.clean_all("") == ""
+        assert TextNormalizer.clean_all(None) == ""
+
+    def test_clean_all_matches_chained_calls(self):
+        samples = ["  x \t\n y ", "a \x01 b", "\x1c\x1fq\x7f\x85", "café\u00a0\x00 ok", "\r\n\x0b\x0c"]
+        for value in samples:
+            expected = TextNormalizer.remove_control_chars(
+                TextNormalizer.normalize_spaces(TextNormalizer.normalize_whitespace(value)),
+            )
+            assert TextNormalizer.clean_all(value) == expected
+
+    def test_remove_control_chars_ascii_and_unicode(self):
+        assert TextNormalizer.remove_control_chars("a\tb\nc\x7fd") == "abcd"
+        assert TextNormalizer.remove_control_chars("café\x00\x85 ok") == "café ok"